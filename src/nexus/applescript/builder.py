@@ -4,6 +4,20 @@ Every function returns an AppleScript source string ready for ``osascript -e``.
 This module has **no** macOS-permission imports and is fully testable on any platform.
 """
 
+# Single-pass translation table used by ``escape_string``.
+_APPLESCRIPT_ESCAPE = str.maketrans(
+    {
+        "\\": "\\\\",
+        '"': '\\"',
+        "\n": "\\n",
+        "\r": "\\r",
+        "\t": "\\t",
+        "\v": "\\v",
+        "\f": "\\f",
+        "\0": None,
+    }
+)
+
 
 def escape_string(value: str) -> str:
     r"""Escape a user-provided string for safe embedding in AppleScript.
@@ -13,16 +27,7 @@ def escape_string(value: str) -> str:
     null bytes. We also strip ``\0`` because AppleScript treats it as a
     string terminator in some scripting additions.
     """
-    return (
-        value.replace("\\", "\\\\")
-        .replace('"', '\\"')
-        .replace("\n", "\\n")
-        .replace("\r", "\\r")
-        .replace("\t", "\\t")
-        .replace("\v", "\\v")
-        .replace("\f", "\\f")
-        .replace("\0", "")
-    )
+    return value.translate(_APPLESCRIPT_ESCAPE)
 
 
 # ---------------------------------------------------------------------------
@@ -85,12 +90,15 @@ def build_open_in_front_window_script(urls: list[str]) -> str:
         "    end if",
     ]
 
-    for url in urls[1:]:
-        safe = escape_string(url)
+    # Remaining URLs go out in one AppleScript list; Safari queues the tab
+    # creation itself, so no per-tab delay is needed.
+    if len(urls) > 1:
+        url_list = ", ".join(f'"{escape_string(url)}"' for url in urls[1:])
         parts.extend(
             [
-                "    delay 0.5",
-                f'    tell front window to make new tab with properties {{URL:"{safe}"}}',
+                f"    repeat with u in {{{url_list}}}",
+                "        tell front window to make new tab with properties {URL:(contents of u)}",
+                "    end repeat",
             ]
         )
 
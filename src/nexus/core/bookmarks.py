@@ -1,11 +1,15 @@
 """Bookmark Manager to handle loading and saving of bookmarks."""
 
+import hashlib
 import json
+import pickle
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any, cast
 
-from nexus.core.config import logger
+from nexus.core.config import Config, logger
 from nexus.core.models import Bookmark, BookmarkFolder, BookmarkNode
+from nexus.utils.json_helpers import load_path
 from nexus.utils.url_processor import URLProcessor
 
 
@@ -20,14 +24,44 @@ DEFAULT_BOOKMARK_FOLDER_NAMES: tuple[str, ...] = (
     "Favorites",
 )
 
+# Bump when the pickled node layout changes so stale parse caches are ignored.
+# The app version is part of the cache file name and key too, so an upgrade
+# that changes URL normalization or the models never opens a cache written
+# by the old code.
+_PARSE_CACHE_VERSION = 2
+
+# The only globals a parse cache may reference; anything else is rejected
+# instead of imported, so a tampered cache cannot run code on load.
+_PARSE_CACHE_CLASSES = {
+    (Bookmark.__module__, Bookmark.__qualname__): Bookmark,
+    (BookmarkFolder.__module__, BookmarkFolder.__qualname__): BookmarkFolder,
+}
+
+
+class _ParseCacheUnpickler(pickle.Unpickler):
+    """Unpickler that only resolves the bookmark model classes."""
+
+    def find_class(self, module: str, name: str) -> Any:
+        try:
+            return _PARSE_CACHE_CLASSES[(module, name)]
+        except KeyError:
+            raise pickle.UnpicklingError(
+                f"Bookmark cache may not reference {module}.{name}"
+            ) from None
+
 
 class BookmarkManager:
     """Handles loading and saving hierarchical bookmarks safely with support for nesting."""
 
-    def __init__(self, file_path: Path):
+    def __init__(self, file_path: Path, cache_dir: Path | None = None):
         self.file_path = file_path
         self.file_path.parent.mkdir(parents=True, exist_ok=True)
         self.url_processor = URLProcessor()
+        # Parse cache in the app cache directory (never beside the user's
+        # data); without a cache_dir every load parses the JSON.
+        self.parse_cache_path = (
+            self._parse_cache_path(cache_dir, file_path) if cache_dir else None
+        )
 
     def load_bookmarks(self) -> list[BookmarkNode]:
         """Loads bookmarks, handles errors, and creates defaults.
@@ -67,10 +101,22 @@ class BookmarkManager:
         Returns ``None`` when the file is corrupt or not a bookmark array so
         callers can try ``.bak`` / defaults. Individual bad nodes are skipped
         without discarding the rest of the library.
+
+        With a cache directory, a successful parse of the primary file is
+        pickled there, keyed by the app version and the file's inode, size
+        and mtime, so an unchanged library skips JSON decoding and URL
+        normalization on the next load.  The ``.bak`` fallback is never
+        cached.
         """
+        cache_key = None
+        if self.parse_cache_path is not None and path == self.file_path:
+            cache_key = self._parse_cache_key(path)
+        cached = self._read_parse_cache(cache_key)
+        if cached is not None:
+            return cached
+
         try:
-            with open(path, encoding="utf-8") as f:
-                data = json.load(f)
+            data = load_path(path)
         except (OSError, json.JSONDecodeError) as e:
             logger.error("Failed to read bookmarks from %s: %s", path, e)
             return None
@@ -83,19 +129,100 @@ class BookmarkManager:
             )
             return None
 
-        bookmarks: list[BookmarkNode] = []
-        for node_data in data:
-            try:
-                bookmarks.append(self._deserialize_node(node_data))
-            except (ValueError, KeyError, TypeError, AttributeError) as e:
-                logger.warning("Skipping invalid bookmark entry: %s", e)
+        sections = [self._deserialize_section(node_data) for node_data in data]
+        bookmarks = [node for node in sections if node is not None]
         logger.info(
             "Loaded %d top-level bookmark sections from %s",
             len(bookmarks),
             path,
         )
+        self._write_parse_cache(cache_key, bookmarks)
         return bookmarks
 
+    @staticmethod
+    def _parse_cache_path(cache_dir: Path, file_path: Path) -> Path:
+        """Return the parse-cache file in *cache_dir* for bookmark *file_path*.
+
+        The name carries the cache format and app versions, so caches from
+        other releases are never opened, and a digest of the bookmark file's
+        location, so separate libraries never share one.
+        """
+        digest = hashlib.sha256(str(file_path.resolve()).encode()).hexdigest()[:16]
+        return cache_dir / (
+            f"{file_path.stem}-{digest}"
+            f"-v{_PARSE_CACHE_VERSION}-{Config.APP_VERSION}.pickle"
+        )
+
+    @staticmethod
+    def _parse_cache_key(path: Path) -> tuple[int | str, ...] | None:
+        """Identify the current contents of *path* without reading it.
+
+        Saves replace the file atomically, so the inode changes on every
+        write even when size and mtime granularity would not.
+        """
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return (
+            _PARSE_CACHE_VERSION,
+            Config.APP_VERSION,
+            stat.st_ino,
+            stat.st_size,
+            stat.st_mtime_ns,
+        )
+
+    def _read_parse_cache(
+        self, cache_key: tuple[int | str, ...] | None
+    ) -> list[BookmarkNode] | None:
+        """Return the cached nodes if the parse cache matches *cache_key*."""
+        if cache_key is None or self.parse_cache_path is None:
+            return None
+        cache_path = self.parse_cache_path
+        try:
+            with open(cache_path, "rb") as f:
+                payload = _ParseCacheUnpickler(f).load()
+        except FileNotFoundError:
+            return None
+        except (
+            OSError,
+            EOFError,
+            pickle.UnpicklingError,
+            AttributeError,
+            ValueError,
+        ) as e:  # a bad cache just means a re-parse
+            logger.debug("Ignoring unreadable bookmark cache %s: %s", cache_path, e)
+            return None
+        if not isinstance(payload, tuple) or len(payload) != 2:
+            return None
+        stored_key, bookmarks = payload
+        if stored_key != cache_key or not isinstance(bookmarks, list):
+            return None
+        logger.info(
+            "Loaded %d top-level bookmark sections from cache for %s",
+            len(bookmarks),
+            self.file_path,
+        )
+        return bookmarks
+
+    def _write_parse_cache(
+        self,
+        cache_key: tuple[int | str, ...] | None,
+        bookmarks: list[BookmarkNode],
+    ) -> None:
+        """Best-effort write of *bookmarks* to the parse cache."""
+        if cache_key is None or self.parse_cache_path is None:
+            return
+        cache_path = self.parse_cache_path
+        temp_path = cache_path.with_suffix(".pickle-tmp")
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp_path, "wb") as f:
+                pickle.dump((cache_key, bookmarks), f, pickle.HIGHEST_PROTOCOL)
+            temp_path.replace(cache_path)
+        except (OSError, pickle.PicklingError, RecursionError) as e:
+            logger.debug("Could not write bookmark cache %s: %s", cache_path, e)
+
     def save_bookmarks(self, bookmarks: list[BookmarkNode]) -> bool:
         """Saves bookmarks using an atomic write process to prevent data loss."""
         backup_path = self.file_path.with_suffix(".bak")
@@ -155,8 +282,7 @@ class BookmarkManager:
         if not self.file_path.exists():
             return []
         try:
-            with open(self.file_path, encoding="utf-8") as f:
-                data = json.load(f)
+            data = load_path(self.file_path)
         except (OSError, json.JSONDecodeError) as e:
             logger.error("Failed to read raw bookmarks from %s: %s", self.file_path, e)
             return []
@@ -183,40 +309,70 @@ class BookmarkManager:
             out["accent"] = node.accent
         return out
 
+    def _deserialize_section(self, data: Any) -> BookmarkNode | None:
+        """Deserialize one top-level entry, or ``None`` if it is invalid."""
+        try:
+            return self._deserialize_node(data)
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.warning("Skipping invalid bookmark entry: %s", e)
+            return None
+
     def _deserialize_node(self, data: dict[str, Any]) -> BookmarkNode:
         """Converts dictionaries from JSON back into dataclass objects.
 
         Unknown entry types (e.g. ``{"type": "group", "id": ...}``) are
-        returned as the raw dict so callers can recognize them.
+        returned as the raw dict so callers can recognize them.  Nested
+        folders are walked with an explicit stack of child iterators, so a
+        deeply nested library cannot exhaust the interpreter's recursion
+        limit; invalid children are skipped without dropping their siblings.
         """
+        node, children_data = self._deserialize_shallow(data)
+        pending: list[tuple[list[BookmarkNode], Iterator[Any]]] = []
+        if children_data:
+            pending.append((cast(BookmarkFolder, node).children, iter(children_data)))
+        while pending:
+            siblings, remaining = pending[-1]
+            for child_data in remaining:
+                try:
+                    child, grandchildren = self._deserialize_shallow(child_data)
+                except (ValueError, KeyError, TypeError, AttributeError) as e:
+                    logger.warning("Skipping invalid bookmark child entry: %s", e)
+                    continue
+                siblings.append(child)
+                if grandchildren:
+                    # Descend; this level resumes once the child is done.
+                    pending.append(
+                        (cast(BookmarkFolder, child).children, iter(grandchildren))
+                    )
+                    break
+            else:
+                pending.pop()
+        return node
+
+    def _deserialize_shallow(
+        self, data: dict[str, Any]
+    ) -> tuple[BookmarkNode, list[Any] | None]:
+        """Convert one node; folders come back empty with their raw children."""
         if not isinstance(data, dict):
             raise TypeError(
                 f"Bookmark node must be an object, got {type(data).__name__}"
             )
         node_type = data.get("type")
         if node_type == "folder":
-            children = []
-            for child in data.get("children", []):
-                try:
-                    children.append(self._deserialize_node(child))
-                except (ValueError, KeyError, TypeError, AttributeError) as e:
-                    logger.warning("Skipping invalid bookmark child entry: %s", e)
-            return BookmarkFolder(
-                name=data["name"],
-                children=children,
-                accent=data.get("accent"),
-            )
+            folder = BookmarkFolder(name=data["name"], accent=data.get("accent"))
+            return folder, list(data.get("children", []))
         if node_type == "bookmark":
             normalized_url = self.url_processor._normalize_url(str(data["url"]))
             if not normalized_url:
                 raise ValueError("Bookmark URL failed validation")
-            return Bookmark(
+            bookmark = Bookmark(
                 name=data["name"],
                 url=normalized_url,
                 accent=data.get("accent"),
             )
+            return bookmark, None
         # Unknown type — treat as a marker dict.
-        return data
+        return data, None
 
     def _create_default_bookmarks(self) -> list[BookmarkNode]:
         """Creates default bookmark folders for common categories."""
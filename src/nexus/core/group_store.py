@@ -9,6 +9,7 @@ from pathlib import Path
 
 from nexus.core.config import logger
 from nexus.core.models import BookmarkGroup, GroupItem
+from nexus.utils.json_helpers import load_path
 
 
 class GroupStore:
@@ -42,8 +43,7 @@ class GroupStore:
 
     def _load_from(self, path: Path) -> list[BookmarkGroup] | None:
         try:
-            with open(path, encoding="utf-8") as f:
-                data = json.load(f)
+            data = load_path(path)
         except (OSError, json.JSONDecodeError) as e:
             logger.error("Failed to read groups from %s: %s", path, e)
             return None
@@ -19,7 +19,7 @@ def _now_iso() -> str:
 # bookmarks.  Avoid using the built-in ``type()`` on instances of these
 # dataclasses; ``type(bookmark)`` will return ``<class Bookmark>``, not
 # the bookmark kind.  Use ``bookmark.type`` for that.
-@dataclass
+@dataclass(slots=True)
 class Bookmark:
     """Represents a single bookmark with name and URL."""
 
@@ -29,7 +29,7 @@ class Bookmark:
     accent: str | None = None  # hex color, e.g. "#E5738A"; None = inherit folder
 
 
-@dataclass
+@dataclass(slots=True)
 class BookmarkFolder:
     """Represents a folder that can contain bookmarks, folders, or markers."""
 
@@ -7,6 +7,7 @@ High-level coordinator that delegates AppleScript construction to
 
 import asyncio
 import random
+from collections import defaultdict
 from urllib.parse import urlparse
 
 from nexus.applescript.builder import (
@@ -107,14 +108,14 @@ class SafariController:
     @staticmethod
     def _group_urls_by_domain(urls: list[str]) -> dict[str, list[str]]:
         """Group URLs by domain for targeted anti-detection strategies."""
-        domain_groups: dict[str, list[str]] = {}
+        domain_groups: defaultdict[str, list[str]] = defaultdict(list)
         for url in urls:
             try:
                 domain = urlparse(url).netloc.lower()
-                domain_groups.setdefault(domain, []).append(url)
-            except (ValueError, AttributeError):
-                domain_groups.setdefault("unknown", []).append(url)
-        return domain_groups
+            except ValueError:
+                domain = "unknown"
+            domain_groups[domain].append(url)
+        return dict(domain_groups)
 
     @staticmethod
     async def _open_urls_with_stealth(
@@ -1,11 +1,17 @@
 """Main Application Window for Nexus."""
 
-import json
 import sys
+from bisect import bisect_right
+from collections import deque
+from collections.abc import Mapping
+from dataclasses import asdict, dataclass
 from datetime import datetime
+from functools import lru_cache, partial
 from pathlib import Path
 from secrets import token_hex
-from typing import Any, cast
+from string import Template
+from types import MappingProxyType, SimpleNamespace
+from typing import Any, Self, cast
 from urllib.parse import urlparse
 
 from PySide6.QtCore import (
@@ -14,8 +20,9 @@ from PySide6.QtCore import (
     QSettings,
     QStandardPaths,
     Qt,
+    QTimer,
 )
-from PySide6.QtGui import QColor, QKeySequence, QShortcut
+from PySide6.QtGui import QKeySequence, QShortcut
 from PySide6.QtWidgets import (
     QAbstractItemView,
     QApplication,
@@ -59,13 +66,638 @@ from nexus.gui.widgets import (
     URLTableWidget,
     WindowTitleBar,
 )
+from nexus.utils.color_helpers import qcolor
+from nexus.utils.json_helpers import dumps_pretty
 from nexus.utils.url_processor import URLProcessor
 from razorcore.appinfo import AboutDialog
 from razorcore.updates import check_for_updates
 
 
+try:
+    import ahocorasick  # optional: pyahocorasick, one-pass multi-token filter
+except ImportError:
+    ahocorasick = None
+
+
 QUICK_SAVE_FOLDER_NAME = "Quick Save"
 
+# Muted dark color themes (3 accents per main tab).
+_RAW_THEMES: dict[str, dict[str, dict[str, str]]] = {
+    "Midnight Blue": {
+        "safari": {
+            "primary": "#4A8FC0",
+            "secondary": "#3A6F98",
+            "accent": "#C45A5A",
+        },
+        "bookmarks": {
+            "primary": "#6B5B95",
+            "secondary": "#534670",
+            "accent": "#5BA86A",
+        },
+        "theme_settings": {
+            "primary": "#4A8FC0",
+            "secondary": "#6B5B95",
+            "accent": "#C4A84A",
+        },
+    },
+    "Rose": {
+        "safari": {
+            "primary": "#C45A8A",
+            "secondary": "#9A456C",
+            "accent": "#5BA86A",
+        },
+        "bookmarks": {
+            "primary": "#7A6BB0",
+            "secondary": "#5C5085",
+            "accent": "#C4A84A",
+        },
+        "theme_settings": {
+            "primary": "#C45A8A",
+            "secondary": "#7A6BB0",
+            "accent": "#5BA86A",
+        },
+    },
+    "Forest": {
+        "safari": {
+            "primary": "#5BA86A",
+            "secondary": "#458054",
+            "accent": "#C4711A",
+        },
+        "bookmarks": {
+            "primary": "#C4A84A",
+            "secondary": "#9A8238",
+            "accent": "#C45A8A",
+        },
+        "theme_settings": {
+            "primary": "#5BA86A",
+            "secondary": "#C4A84A",
+            "accent": "#4A8FC0",
+        },
+    },
+    "Violet": {
+        "safari": {
+            "primary": "#7A6BB0",
+            "secondary": "#5C5085",
+            "accent": "#C4A84A",
+        },
+        "bookmarks": {
+            "primary": "#4A8FC0",
+            "secondary": "#3A6F98",
+            "accent": "#C45A5A",
+        },
+        "theme_settings": {
+            "primary": "#7A6BB0",
+            "secondary": "#C45A8A",
+            "accent": "#5BA86A",
+        },
+    },
+    "Ember": {
+        "safari": {
+            "primary": "#C4711A",
+            "secondary": "#9A5814",
+            "accent": "#4A8FC0",
+        },
+        "bookmarks": {
+            "primary": "#C45A8A",
+            "secondary": "#9A456C",
+            "accent": "#5BA86A",
+        },
+        "theme_settings": {
+            "primary": "#C4711A",
+            "secondary": "#C45A8A",
+            "accent": "#7A6BB0",
+        },
+    },
+}
+
+_DEFAULT_THEME_NAME = "Midnight Blue"
+_THEME_KEYS: tuple[tuple[str, str], ...] = tuple(
+    (tab_key, color_key)
+    for tab_key in ("safari", "bookmarks", "theme_settings")
+    for color_key in ("primary", "secondary", "accent")
+)
+
+# Frozen once at import and shared by every window; access colors as
+# ``THEMES["Midnight Blue"].safari.primary``.
+THEMES: Mapping[str, SimpleNamespace] = MappingProxyType(
+    {
+        name: SimpleNamespace(
+            **{tab: SimpleNamespace(**colors) for tab, colors in tabs.items()}
+        )
+        for name, tabs in _RAW_THEMES.items()
+    }
+)
+
+
+@dataclass(slots=True)
+class ThemeColors:
+    """Flat palette for the active theme; fields are named ``<tab>_<color>``."""
+
+    safari_primary: str
+    safari_secondary: str
+    safari_accent: str
+    bookmarks_primary: str
+    bookmarks_secondary: str
+    bookmarks_accent: str
+    theme_settings_primary: str
+    theme_settings_secondary: str
+    theme_settings_accent: str
+
+    @classmethod
+    def from_preset(cls, preset: SimpleNamespace) -> Self:
+        """Build a palette from one of the ``THEMES`` entries."""
+        return cls(
+            **{
+                f"{tab_key}_{color_key}": getattr(getattr(preset, tab_key), color_key)
+                for tab_key, color_key in _THEME_KEYS
+            }
+        )
+
+    def as_dict(self) -> dict[str, str]:
+        """Return the palette keyed by field name, e.g. for QSettings."""
+        return asdict(self)
+
+
+# Static Glass Noir shell styling, scoped by objectName and applied once at
+# the window root by ``MainWindow._apply_theme``.
+_WINDOW_QSS = """
+QMainWindow {
+    background: transparent;
+    border: none;
+}
+QWidget#centralWidget,
+QWidget#headerWidget,
+QWidget#contentWidget,
+QWidget#mainContent {
+    background: transparent;
+}
+QFrame#headerRule {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+        stop:0 rgba(74, 144, 232, 0.0),
+        stop:0.18 rgba(74, 144, 232, 0.70),
+        stop:0.50 rgba(155, 122, 232, 0.65),
+        stop:0.82 rgba(46, 196, 160, 0.70),
+        stop:1 rgba(74, 144, 232, 0.0));
+    border: none;
+    border-radius: 1px;
+}
+QWidget#bookmarkSidebar {
+    background: rgba(2, 6, 14, 0.88);
+    border-right: 1px solid rgba(74, 144, 232, 0.28);
+    border-radius: 0px;
+}
+QPushButton#addFolderButton {
+    background: rgba(74, 144, 232, 0.22);
+    border: 1px solid rgba(120, 180, 255, 0.55);
+    border-radius: 7px;
+    color: #E8F2FF;
+    font-family: "Helvetica Neue", sans-serif;
+    font-size: 18px;
+    font-weight: 500;
+    padding: 0px;
+    margin: 0px;
+}
+QPushButton#addFolderButton:hover {
+    background: rgba(74, 144, 232, 0.38);
+    color: #FFFFFF;
+}
+QPushButton#addFolderButton:pressed {
+    background: rgba(74, 144, 232, 0.16);
+}
+QLineEdit#bookmarkSearch {
+    background: rgba(2, 6, 14, 0.95);
+    border: 1px solid rgba(74, 144, 232, 0.35);
+    border-radius: 9px;
+    color: #F0F4FA;
+    padding: 9px 14px;
+    font-size: 14px;
+    font-family: "Helvetica Neue", sans-serif;
+    selection-background-color: rgba(74, 144, 232, 0.55);
+}
+QLineEdit#bookmarkSearch:focus {
+    border: 1px solid rgba(120, 180, 255, 0.75);
+    background: rgba(2, 6, 14, 1.0);
+}
+QLineEdit#bookmarkSearch::placeholder {
+    color: rgba(148, 168, 200, 0.75);
+}
+QTreeWidget#bookmarkTree {
+    background: transparent;
+    border: none;
+    outline: none;
+    color: transparent;
+}
+QTreeWidget#bookmarkTree::item {
+    padding: 0px;
+    margin: 0px;
+    border: none;
+    background: transparent;
+}
+QTreeWidget#bookmarkTree::branch {
+    image: none;
+    border: none;
+    background: transparent;
+}
+QTreeWidget#bookmarkTree QScrollBar:vertical {
+    border-radius: 3px;
+}
+QTreeWidget#bookmarkTree QScrollBar:vertical,
+QTableWidget#urlTable QScrollBar:vertical {
+    background: transparent;
+    width: 6px;
+    margin: 4px 0;
+}
+QTreeWidget#bookmarkTree QScrollBar::handle:vertical,
+QTableWidget#urlTable QScrollBar::handle:vertical {
+    background: rgba(255, 255, 255, 0.16);
+    border-radius: 3px;
+    min-height: 24px;
+}
+QTreeWidget#bookmarkTree QScrollBar::handle:vertical:hover,
+QTableWidget#urlTable QScrollBar::handle:vertical:hover {
+    background: rgba(255, 255, 255, 0.26);
+}
+QTreeWidget#bookmarkTree QScrollBar::add-line:vertical,
+QTreeWidget#bookmarkTree QScrollBar::sub-line:vertical,
+QTableWidget#urlTable QScrollBar::add-line:vertical,
+QTableWidget#urlTable QScrollBar::sub-line:vertical {
+    height: 0px;
+}
+QTreeWidget#bookmarkTree QScrollBar::add-page:vertical,
+QTreeWidget#bookmarkTree QScrollBar::sub-page:vertical,
+QTableWidget#urlTable QScrollBar::add-page:vertical,
+QTableWidget#urlTable QScrollBar::sub-page:vertical {
+    background: transparent;
+}
+QPushButton#loadFileButton {
+    background: rgba(46, 196, 160, 0.15);
+    border: 1px solid rgba(46, 196, 160, 0.45);
+    border-radius: 6px;
+    color: #7AF0D0;
+    font-family: "Helvetica Neue", sans-serif;
+    font-size: 12px;
+    font-weight: 600;
+    padding: 4px 14px;
+}
+QPushButton#loadFileButton:hover {
+    background: rgba(46, 196, 160, 0.28);
+    color: #AAFAE8;
+}
+QPushButton#loadFileButton:pressed {
+    background: rgba(46, 196, 160, 0.10);
+}
+QWidget#urlWell {
+    background: rgb(3, 7, 16);
+    border: 1px solid rgba(74, 144, 232, 0.22);
+    border-radius: 12px;
+}
+QTableWidget#urlTable {
+    background: transparent;
+    border: none;
+    color: #F0F4FA;
+    font-size: 15px;
+    outline: none;
+    selection-background-color: transparent;
+}
+QTableWidget#urlTable::item {
+    padding: 0px;
+    border: none;
+    background: transparent;
+}
+QTableWidget#urlTable QLineEdit {
+    background: transparent;
+    border: none;
+    color: #F0F4FA;
+    padding-left: 16px;
+    font-size: 15px;
+    selection-background-color: rgba(110, 130, 168, 0.45);
+}
+QLabel#urlCounter {
+    color: #4AE89A;
+    font-size: 13px;
+    font-weight: 600;
+    letter-spacing: 0.2px;
+    padding-top: 2px;
+    padding-right: 4px;
+}
+QLabel#statusBar {
+    color: #6A7890;
+    font-size: 12px;
+    padding-right: 4px;
+}
+QMenu#bookmarkMenu,
+QMenu#bookmarkMenu QMenu,
+QMenu#richLinksMenu,
+QMenu#quickSaveMenu {
+    background-color: #1C1F27;
+    color: #E8ECF4;
+    border: 1px solid rgba(255, 255, 255, 0.10);
+    border-radius: 8px;
+    padding: 4px;
+}
+QMenu#bookmarkMenu::item,
+QMenu#bookmarkMenu QMenu::item,
+QMenu#richLinksMenu::item,
+QMenu#quickSaveMenu::item {
+    padding: 6px 16px;
+    border-radius: 4px;
+}
+QMenu#bookmarkMenu::item:selected,
+QMenu#bookmarkMenu QMenu::item:selected,
+QMenu#richLinksMenu::item:selected,
+QMenu#quickSaveMenu::item:selected {
+    color: #E8ECF4;
+}
+QMenu#bookmarkMenu::item:selected,
+QMenu#bookmarkMenu QMenu::item:selected {
+    background-color: rgba(91, 141, 239, 0.28);
+}
+QMenu#richLinksMenu::item:selected,
+QMenu#quickSaveMenu::item:selected {
+    background-color: rgba(46, 196, 160, 0.28);
+}
+"""
+
+# Message box sheets are parsed into Templates once; only the accent varies.
+_WARNING_BOX_QSS = Template("""
+QMessageBox {
+    background: #1e1e1e;
+    color: #fff;
+}
+QMessageBox QPushButton {
+    background: $color;
+    color: #d0d0d0;
+    border: none;
+    padding: 8px 16px;
+    border-radius: 4px;
+}
+""")
+_MESSAGE_BOX_QSS = Template(
+    "background-color: #1e1e1e; color: #fff; QPushButton { background-color: $color;"
+    " color: #fff; padding: 5px 10px; border-radius: 4px; }"
+)
+
+_FALLBACK_FOLDER_STYLES: tuple[dict[str, str], ...] = (
+    {
+        "start": "#5B8DEF",
+        "end": "#092B59",
+        "border": "#9AD4FF",
+        "icon": "#E8F7FF",
+    },
+    {
+        "start": "#9B7AE8",
+        "end": "#250854",
+        "border": "#D6B5FF",
+        "icon": "#F3E8FF",
+    },
+    {
+        "start": "#4DB6A0",
+        "end": "#07312B",
+        "border": "#9CE8D8",
+        "icon": "#ECFFF8",
+    },
+    {
+        "start": "#E5738A",
+        "end": "#3E081F",
+        "border": "#EAB0C9",
+        "icon": "#FFE5EF",
+    },
+    {
+        "start": "#D4A05A",
+        "end": "#4A2603",
+        "border": "#F0CB93",
+        "icon": "#FFF5D7",
+    },
+    {
+        "start": "#6B9AF5",
+        "end": "#162B67",
+        "border": "#B5C5FF",
+        "icon": "#F1F3FF",
+    },
+)
+_BOOKMARK_FOLDER_ORDER: Mapping[str, int] = MappingProxyType(
+    {
+        name.lower(): index
+        for index, name in enumerate(
+            (QUICK_SAVE_FOLDER_NAME, *DEFAULT_BOOKMARK_FOLDER_NAMES)
+        )
+    }
+)
+
+
+@lru_cache(maxsize=4096)
+def _netloc_and_path(url: str) -> tuple[str, str]:
+    """Return ``(netloc, path)`` for *url*; repeated URLs are parsed once."""
+    parsed = urlparse(url)
+    return parsed.netloc, parsed.path
+
+
+def _encode_search_text(text: str) -> bytes:
+    """Encode filter text as UTF-8; lone surrogates from JSON are kept."""
+    return text.encode("utf-8", "surrogatepass")
+
+
+# Item data role holding a bookmark row's precomputed, lowercased search text.
+# ``UserRole`` is the node dict and ``UserRole + 1`` the folder style.
+_SEARCH_TEXT_ROLE = Qt.ItemDataRole.UserRole + 2
+
+
+def _bookmark_search_text(data: Mapping[str, Any]) -> str:
+    """Return the lowercased ``name NUL url`` text the sidebar filter scans."""
+    name = data.get("name") or ""
+    url = data.get("url") or ""
+    return f"{name.lower()}\0{url.lower()}"
+
+
+@lru_cache(maxsize=64)
+def _token_automaton(tokens: tuple[str, ...]):
+    """Return an Aho-Corasick automaton over *tokens*, built once per query."""
+    automaton = ahocorasick.Automaton()
+    for token in tokens:
+        automaton.add_word(token, len(token))
+    automaton.make_automaton()
+    return automaton
+
+
+class _BookmarkSearchIndex:
+    """Flat, parallel-array snapshot of the bookmark tree for the sidebar filter.
+
+    Row ``i`` describes ``items[i]``: ``parents[i]`` is the row of its folder
+    (``-1`` for top-level folders), a folder's bookmarks fill the rows up to
+    ``child_ends[i]``, and its lowercased, UTF-8 encoded search text starts
+    at byte ``starts[i]`` in ``blob``.  Fields are NUL-separated, so a query
+    (which never contains NUL) matches inside a single field, and answering
+    it is a ``bytes.find`` sweep over one buffer instead of a per-item
+    Python check.  UTF-8 keeps the buffer one byte per ASCII character even
+    when a few names are not ASCII, and, being self-synchronizing, only
+    matches an encoded query at character boundaries.
+    """
+
+    __slots__ = (
+        "all_rows",
+        "blob",
+        "child_ends",
+        "fields",
+        "folder_rows",
+        "hidden_rows",
+        "items",
+        "last_query",
+        "last_rows",
+        "last_token",
+        "parents",
+        "starts",
+        "text_blob",
+        "text_starts",
+    )
+
+    def __init__(self, tree: QTreeWidget) -> None:
+        self.items: list[QTreeWidgetItem] = []
+        self.parents: list[int] = []
+        self.starts: list[int] = []
+        fields: list[bytes] = []
+        offset = 0
+
+        def add(item: QTreeWidgetItem, parent: int, text: str) -> None:
+            nonlocal offset
+            field = _encode_search_text(text)
+            self.items.append(item)
+            self.parents.append(parent)
+            self.starts.append(offset)
+            fields.append(field)
+            offset += len(field) + 1
+
+        self.child_ends: list[int] = []
+        self.folder_rows: list[int] = []
+        root = tree.invisibleRootItem()
+        for i in range(root.childCount()):
+            folder_item = root.child(i)
+            folder_row = len(self.items)
+            self.folder_rows.append(folder_row)
+            add(folder_item, -1, folder_item.text(0).lower())
+            for j in range(folder_item.childCount()):
+                bookmark_item = folder_item.child(j)
+                # Bookmarks match on their stored name and URL, not the label;
+                # rows built by _build_tree_node carry the text precomputed.
+                text = bookmark_item.data(0, _SEARCH_TEXT_ROLE)
+                if text is None:
+                    data = bookmark_item.data(0, Qt.ItemDataRole.UserRole)
+                    text = _bookmark_search_text(data) if data else ""
+                add(bookmark_item, folder_row, text)
+            # A folder's bookmarks are the rows right after it.
+            self.child_ends.extend([len(self.items)] * (len(self.items) - folder_row))
+
+        self.fields = fields
+        self.blob = b"\0".join(fields)
+        # Decoded view for the Aho-Corasick path, built on first use.
+        self.text_blob: str | None = None
+        self.text_starts: list[int] = []
+        self.all_rows = frozenset(range(len(self.items)))
+        # Rows last hidden through Qt, so unchanged rows cost no call.
+        self.hidden_rows = {
+            row for row, item in enumerate(self.items) if item.isHidden()
+        }
+        # Query last applied to the tree by _filter_bookmarks.
+        self.last_query: str | None = None
+        # Previous single-token query and its matching rows.
+        self.last_token = b""
+        self.last_rows: list[int] = []
+
+    def matching_rows(self, query: str) -> list[int]:
+        """Return the rows whose text contains any token of *query*.
+
+        Tokens are the whitespace-separated words of *query*.  While a
+        single-token query only grows (typing "git" -> "gith"), just the rows
+        that matched the previous token are rechecked: no other row can
+        match the new one.
+        """
+        tokens = tuple(dict.fromkeys(query.split()))
+        if not tokens:
+            return []
+        if len(tokens) == 1:
+            token = _encode_search_text(tokens[0])
+            if self.last_token and self.last_token in token:
+                fields = self.fields
+                rows = [row for row in self.last_rows if token in fields[row]]
+            else:
+                rows = self._rows_containing(token)
+            self.last_token, self.last_rows = token, rows
+            return rows
+
+        self.last_token, self.last_rows = b"", []
+        if ahocorasick is not None:
+            # All tokens in a single pass over the (decoded) blob.
+            if self.text_blob is None:
+                self._build_text_view()
+            text_blob, text_starts = cast(str, self.text_blob), self.text_starts
+            hits = {
+                bisect_right(text_starts, end - length + 1) - 1
+                for end, length in _token_automaton(tokens).iter(text_blob)
+            }
+            return sorted(hits)
+        hits = set()
+        for token in tokens:
+            hits.update(self._rows_containing(_encode_search_text(token)))
+        return sorted(hits)
+
+    def _build_text_view(self) -> None:
+        """Decode the blob once, with per-row character offsets."""
+        texts = [field.decode("utf-8", "surrogatepass") for field in self.fields]
+        self.text_blob = "\0".join(texts)
+        offset = 0
+        for text in texts:
+            self.text_starts.append(offset)
+            offset += len(text) + 1
+
+    def matches(self, query: str) -> list[bool]:
+        """Return, per row, whether any token of *query* occurs in its text."""
+        matched = [False] * len(self.items)
+        for row in self.matching_rows(query):
+            matched[row] = True
+        return matched
+
+    def _rows_containing(self, token: bytes) -> list[int]:
+        """Return the rows whose text contains *token*, in row order."""
+        rows: list[int] = []
+        blob, starts = self.blob, self.starts
+        last_row = len(starts) - 1
+        pos = blob.find(token)
+        while pos != -1:
+            row = bisect_right(starts, pos) - 1
+            rows.append(row)
+            if row == last_row:
+                break
+            # Resume at the next row; one hit per row is enough.
+            pos = blob.find(token, starts[row + 1])
+        return rows
+
+    def shown_rows(self, query: str) -> set[int]:
+        """Return the rows to show for *query*.
+
+        A bookmark is shown when it or its folder matches; a folder is shown
+        when it matches or has a visible bookmark.  A blank query shows all.
+        Only matching rows are visited: a folder's bookmarks are the rows up
+        to ``child_ends[folder]``, so no per-item parent walk is needed.
+        """
+        if not query or query.isspace():
+            return set(self.all_rows)
+        parents, child_ends = self.parents, self.child_ends
+        shown: set[int] = set()
+        for row in self.matching_rows(query):
+            parent = parents[row]
+            if parent < 0:
+                shown.update(range(row, child_ends[row]))
+            else:
+                shown.add(row)
+                shown.add(parent)
+        return shown
+
+    def visibility(self, query: str) -> list[bool]:
+        """Return, per row, whether the row should be shown for *query*."""
+        visible = [False] * len(self.items)
+        for row in self.shown_rows(query):
+            visible[row] = True
+        return visible
+
 
 class MainWindow(QMainWindow):
     """The main application window with hierarchical bookmark support."""
@@ -91,12 +723,36 @@ class MainWindow(QMainWindow):
         super().__init__()
         self._setup_themes()  # Define themes
         self.settings = QSettings()
+        # Writes are staged here and flushed to QSettings once on close.
+        self._pending_settings: dict[str, Any] = {}
+        # Top-level folder name -> item; entries are validated on lookup.
+        self._folder_index: dict[str, QTreeWidgetItem] = {}
+        self._bookmark_search_index: _BookmarkSearchIndex | None = None
         self.restored_window_geometry = False
         self._load_settings()  # Load saved theme or default
         self.private_mode_enabled = Config.DEFAULT_PRIVATE_MODE
         self._url_history: list[list[str]] = []
         self._current_url_snapshot: list[str] = []
         self._restoring_url_history = False
+        # Bookmark clicks arriving close together are opened in one batch.
+        self._pending_bookmark_urls: list[str] = []
+        self._bookmark_flush_timer = QTimer(self)
+        self._bookmark_flush_timer.setSingleShot(True)
+        self._bookmark_flush_timer.setInterval(50)
+        self._bookmark_flush_timer.timeout.connect(self._flush_pending_bookmark_urls)
+        # Bursts of tree edits are written to disk once, 300 ms after the last.
+        self._bookmark_save_timer = QTimer(self)
+        self._bookmark_save_timer.setSingleShot(True)
+        self._bookmark_save_timer.setInterval(300)
+        self._bookmark_save_timer.timeout.connect(self._save_bookmarks_now)
+
+        # Rapid typing in the sidebar search collapses into one filter pass.
+        self._bookmark_filter_timer = QTimer(self)
+        self._bookmark_filter_timer.setSingleShot(True)
+        self._bookmark_filter_timer.setInterval(50)
+        self._bookmark_filter_timer.timeout.connect(
+            lambda: self._filter_bookmarks(self.search_bar.text())
+        )
 
         self.url_processor = URLProcessor()
         self.link_converter = LinkConverter()
@@ -107,7 +763,13 @@ class MainWindow(QMainWindow):
                 QStandardPaths.StandardLocation.AppDataLocation
             )
         )
-        self.bookmark_manager = BookmarkManager(app_data_dir / Config.BOOKMARKS_FILE)
+        cache_location = QStandardPaths.writableLocation(
+            QStandardPaths.StandardLocation.CacheLocation
+        )
+        self.bookmark_manager = BookmarkManager(
+            app_data_dir / Config.BOOKMARKS_FILE,
+            cache_dir=Path(cache_location) if cache_location else None,
+        )
 
         from nexus.core.group_store import GroupStore
 
@@ -127,98 +789,12 @@ class MainWindow(QMainWindow):
         )
 
     def _setup_themes(self):
-        """Defines muted dark color themes (3 accents per main tab)."""
-        self.themes = {
-            "Midnight Blue": {
-                "safari": {
-                    "primary": "#4A8FC0",
-                    "secondary": "#3A6F98",
-                    "accent": "#C45A5A",
-                },
-                "bookmarks": {
-                    "primary": "#6B5B95",
-                    "secondary": "#534670",
-                    "accent": "#5BA86A",
-                },
-                "theme_settings": {
-                    "primary": "#4A8FC0",
-                    "secondary": "#6B5B95",
-                    "accent": "#C4A84A",
-                },
-            },
-            "Rose": {
-                "safari": {
-                    "primary": "#C45A8A",
-                    "secondary": "#9A456C",
-                    "accent": "#5BA86A",
-                },
-                "bookmarks": {
-                    "primary": "#7A6BB0",
-                    "secondary": "#5C5085",
-                    "accent": "#C4A84A",
-                },
-                "theme_settings": {
-                    "primary": "#C45A8A",
-                    "secondary": "#7A6BB0",
-                    "accent": "#5BA86A",
-                },
-            },
-            "Forest": {
-                "safari": {
-                    "primary": "#5BA86A",
-                    "secondary": "#458054",
-                    "accent": "#C4711A",
-                },
-                "bookmarks": {
-                    "primary": "#C4A84A",
-                    "secondary": "#9A8238",
-                    "accent": "#C45A8A",
-                },
-                "theme_settings": {
-                    "primary": "#5BA86A",
-                    "secondary": "#C4A84A",
-                    "accent": "#4A8FC0",
-                },
-            },
-            "Violet": {
-                "safari": {
-                    "primary": "#7A6BB0",
-                    "secondary": "#5C5085",
-                    "accent": "#C4A84A",
-                },
-                "bookmarks": {
-                    "primary": "#4A8FC0",
-                    "secondary": "#3A6F98",
-                    "accent": "#C45A5A",
-                },
-                "theme_settings": {
-                    "primary": "#7A6BB0",
-                    "secondary": "#C45A8A",
-                    "accent": "#5BA86A",
-                },
-            },
-            "Ember": {
-                "safari": {
-                    "primary": "#C4711A",
-                    "secondary": "#9A5814",
-                    "accent": "#4A8FC0",
-                },
-                "bookmarks": {
-                    "primary": "#C45A8A",
-                    "secondary": "#9A456C",
-                    "accent": "#5BA86A",
-                },
-                "theme_settings": {
-                    "primary": "#C4711A",
-                    "secondary": "#C45A8A",
-                    "accent": "#7A6BB0",
-                },
-            },
-        }
+        """Binds the shared, read-only theme table (built once per process)."""
+        self.themes = THEMES
 
     def _load_settings(self):
         """Loads theme settings from QSettings."""
-        default_theme_name = "Midnight Blue"
+        default_theme_name = _DEFAULT_THEME_NAME
         default_theme_colors = self.themes[default_theme_name]
 
         saved_name = self.settings.value("theme/name", default_theme_name)
@@ -234,59 +810,62 @@ class MainWindow(QMainWindow):
         if self.current_theme_name not in self.themes:
             self.current_theme_name = default_theme_name
         if saved_name != self.current_theme_name:
-            self.settings.setValue("theme/name", self.current_theme_name)
+            self._set_setting("theme/name", self.current_theme_name)
 
         # Initialize current_theme with default structure
-        self.current_theme = {
-            "safari": {
-                "primary": "#4A8FC0",
-                "secondary": "#3A6F98",
-                "accent": "#C45A5A",
-            },
-            "bookmarks": {
-                "primary": "#6B5B95",
-                "secondary": "#534670",
-                "accent": "#5BA86A",
-            },
-            "theme_settings": {
-                "primary": "#4A8FC0",
-                "secondary": "#6B5B95",
-                "accent": "#C4A84A",
-            },
-        }
+        self.current_theme = ThemeColors.from_preset(default_theme_colors)
 
         if self.current_theme_name == "Custom":
-            for tab_key in ["safari", "bookmarks", "theme_settings"]:
-                for color_key in ["primary", "secondary", "accent"]:
-                    default_val = default_theme_colors.get(tab_key, {}).get(
-                        color_key, "#ffffff"
-                    )
-                    self.current_theme[tab_key][color_key] = str(
-                        self.settings.value(
-                            f"theme/custom_{tab_key}_{color_key}", default_val
-                        )
+            # Read every stored custom color in one pass over the theme group;
+            # colors that were never saved keep the default seeded above.
+            self.settings.beginGroup("theme")
+            try:
+                stored = {
+                    key: str(self.settings.value(key))
+                    for key in self.settings.childKeys()
+                    if key.startswith("custom_")
+                }
+            finally:
+                self.settings.endGroup()
+            for tab_key, color_key in _THEME_KEYS:
+                field_name = f"{tab_key}_{color_key}"
+                if f"custom_{field_name}" in stored:
+                    setattr(
+                        self.current_theme, field_name, stored[f"custom_{field_name}"]
                     )
         else:
             # Load preset colors and save them as custom for editing
-            theme_name = str(self.current_theme_name)
-            preset_colors_raw = self.themes.get(theme_name, default_theme_colors)
-            preset_colors: dict[str, Any] = (
-                preset_colors_raw
-                if isinstance(preset_colors_raw, dict)
-                else default_theme_colors
-            )
-            for tab_key in ["safari", "bookmarks", "theme_settings"]:
-                for color_key in ["primary", "secondary", "accent"]:
-                    tab_colors = preset_colors.get(tab_key, {})
-                    color_val = (
-                        tab_colors.get(color_key, "#ffffff")
-                        if isinstance(tab_colors, dict)
-                        else "#ffffff"
-                    )
-                    self.current_theme[tab_key][color_key] = color_val
-                    self.settings.setValue(
-                        f"theme/custom_{tab_key}_{color_key}", color_val
-                    )
+            self._load_preset_into_current(str(self.current_theme_name))
+            for field_name, color_val in self.current_theme.as_dict().items():
+                self._set_setting(f"theme/custom_{field_name}", color_val)
+
+    def _set_setting(self, key: str, value: Any) -> None:
+        """Stage a settings write; it is persisted by ``_flush_settings``."""
+        self._pending_settings[key] = value
+
+    def _get_setting(
+        self, key: str, default: Any = None, value_type: type | None = None
+    ) -> Any:
+        """Read a setting, preferring a staged value over the stored one."""
+        if key in self._pending_settings:
+            return self._pending_settings[key]
+        if value_type is None:
+            return self.settings.value(key, default)
+        return self.settings.value(key, default, type=value_type)
+
+    def _flush_settings(self) -> None:
+        """Write all staged settings and sync QSettings once."""
+        if not self._pending_settings:
+            return
+        for key, value in self._pending_settings.items():
+            self.settings.setValue(key, value)
+        self._pending_settings.clear()
+        self.settings.sync()
+
+    def _load_preset_into_current(self, name: str) -> None:
+        """Replace current_theme with the colors of preset *name*."""
+        preset = self.themes.get(name, self.themes[_DEFAULT_THEME_NAME])
+        self.current_theme = ThemeColors.from_preset(preset)
 
     def _setup_window(self):
         """Sets up the main window properties for the cosmic glass shell."""
@@ -296,18 +875,12 @@ class MainWindow(QMainWindow):
         if sys.platform == "darwin":
             self.setWindowFlag(Qt.WindowType.FramelessWindowHint, True)
             self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, True)
-        self.setStyleSheet("""
-            QMainWindow {
-                background: transparent;
-                border: none;
-            }
-        """)
 
     def _setup_ui(self):
         """Sets up the single-frame Nexus UI inspired by the provided reference."""
         central_widget = QWidget()
         central_widget.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, True)
-        central_widget.setStyleSheet("background: transparent;")
+        central_widget.setObjectName("centralWidget")
         self.setCentralWidget(central_widget)
 
         root_layout = QVBoxLayout(central_widget)
@@ -326,7 +899,7 @@ class MainWindow(QMainWindow):
             main_layout.addWidget(self.window_titlebar)
 
         header_widget = QWidget()
-        header_widget.setStyleSheet("background: transparent;")
+        header_widget.setObjectName("headerWidget")
         header_layout = QVBoxLayout(header_widget)
         header_layout.setContentsMargins(0, 0, 0, 0)
         header_layout.setSpacing(4)
@@ -356,22 +929,11 @@ class MainWindow(QMainWindow):
 
         header_rule = QFrame()
         header_rule.setFixedHeight(2)
-        header_rule.setStyleSheet(
-            """
-            background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                stop:0 rgba(74, 144, 232, 0.0),
-                stop:0.18 rgba(74, 144, 232, 0.70),
-                stop:0.50 rgba(155, 122, 232, 0.65),
-                stop:0.82 rgba(46, 196, 160, 0.70),
-                stop:1 rgba(74, 144, 232, 0.0));
-            border: none;
-            border-radius: 1px;
-            """
-        )
+        header_rule.setObjectName("headerRule")
         main_layout.addWidget(header_rule)
 
         content_widget = QWidget()
-        content_widget.setStyleSheet("background: transparent;")
+        content_widget.setObjectName("contentWidget")
         content_layout = QHBoxLayout(content_widget)
         content_layout.setContentsMargins(0, 0, 0, 0)
         content_layout.setSpacing(22)
@@ -379,13 +941,6 @@ class MainWindow(QMainWindow):
         self.sidebar = QWidget()
         self.sidebar.setFixedWidth(260)
         self.sidebar.setObjectName("bookmarkSidebar")
-        self.sidebar.setStyleSheet("""
-            QWidget#bookmarkSidebar {
-                background: rgba(2, 6, 14, 0.88);
-                border-right: 1px solid rgba(74, 144, 232, 0.28);
-                border-radius: 0px;
-            }
-        """)
         sidebar_layout = QVBoxLayout(self.sidebar)
         sidebar_layout.setContentsMargins(12, 16, 14, 12)
         sidebar_layout.setSpacing(14)
@@ -407,26 +962,7 @@ class MainWindow(QMainWindow):
         self.add_folder_btn.setToolTip("Add folder")
         self.add_folder_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         self.add_folder_btn.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-        self.add_folder_btn.setStyleSheet("""
-            QPushButton {
-                background: rgba(74, 144, 232, 0.22);
-                border: 1px solid rgba(120, 180, 255, 0.55);
-                border-radius: 7px;
-                color: #E8F2FF;
-                font-family: "Helvetica Neue", sans-serif;
-                font-size: 18px;
-                font-weight: 500;
-                padding: 0px;
-                margin: 0px;
-            }
-            QPushButton:hover {
-                background: rgba(74, 144, 232, 0.38);
-                color: #FFFFFF;
-            }
-            QPushButton:pressed {
-                background: rgba(74, 144, 232, 0.16);
-            }
-        """)
+        self.add_folder_btn.setObjectName("addFolderButton")
         sidebar_header_layout.addWidget(
             self.add_folder_btn,
             0,
@@ -436,27 +972,9 @@ class MainWindow(QMainWindow):
 
         self.search_bar = BookmarkSearchBar()
         self.search_bar.setPlaceholderText("Filter bookmarks")
-        self.search_bar.textChanged.connect(self._filter_bookmarks)
+        self.search_bar.textChanged.connect(self._schedule_bookmark_filter)
         self.search_bar.urls_pasted.connect(self._handle_pasted_urls)
-        self.search_bar.setStyleSheet("""
-            QLineEdit {
-                background: rgba(2, 6, 14, 0.95);
-                border: 1px solid rgba(74, 144, 232, 0.35);
-                border-radius: 9px;
-                color: #F0F4FA;
-                padding: 9px 14px;
-                font-size: 14px;
-                font-family: "Helvetica Neue", sans-serif;
-                selection-background-color: rgba(74, 144, 232, 0.55);
-            }
-            QLineEdit:focus {
-                border: 1px solid rgba(120, 180, 255, 0.75);
-                background: rgba(2, 6, 14, 1.0);
-            }
-            QLineEdit::placeholder {
-                color: rgba(148, 168, 200, 0.75);
-            }
-        """)
+        self.search_bar.setObjectName("bookmarkSearch")
         self.search_bar.setFixedHeight(38)
         sidebar_layout.addWidget(self.search_bar)
 
@@ -483,52 +1001,23 @@ class MainWindow(QMainWindow):
             QAbstractItemView.SelectionMode.SingleSelection
         )
         self.bookmark_tree.model().rowsMoved.connect(self._on_top_level_reordered)
+        tree_model = self.bookmark_tree.model()
+        for signal in (
+            tree_model.rowsInserted,
+            tree_model.rowsRemoved,
+            tree_model.rowsMoved,
+            tree_model.dataChanged,
+            tree_model.modelReset,
+        ):
+            signal.connect(self._invalidate_bookmark_search_index)
         self.bookmark_tree.setItemDelegate(BookmarkTreeDelegate(self.bookmark_tree))
-        self.bookmark_tree.setStyleSheet("""
-            QTreeWidget {
-                background: transparent;
-                border: none;
-                outline: none;
-                color: transparent;
-            }
-            QTreeWidget::item {
-                padding: 0px;
-                margin: 0px;
-                border: none;
-                background: transparent;
-            }
-            QTreeWidget::branch {
-                image: none;
-                border: none;
-                background: transparent;
-            }
-            QScrollBar:vertical {
-                background: transparent;
-                width: 6px;
-                margin: 4px 0;
-                border-radius: 3px;
-            }
-            QScrollBar::handle:vertical {
-                background: rgba(255, 255, 255, 0.16);
-                border-radius: 3px;
-                min-height: 24px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: rgba(255, 255, 255, 0.26);
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0px;
-            }
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
-                background: transparent;
-            }
-        """)
+        self.bookmark_tree.setObjectName("bookmarkTree")
         sidebar_layout.addWidget(self.bookmark_tree, 1)
 
         content_layout.addWidget(self.sidebar)
 
         main_content = QWidget()
-        main_content.setStyleSheet("background: transparent;")
+        main_content.setObjectName("mainContent")
         main_content_layout = QVBoxLayout(main_content)
         main_content_layout.setContentsMargins(4, 12, 0, 0)
         main_content_layout.setSpacing(12)
@@ -546,91 +1035,25 @@ class MainWindow(QMainWindow):
         self.load_file_btn.setFixedHeight(28)
         self.load_file_btn.setFocusPolicy(Qt.FocusPolicy.NoFocus)
         self.load_file_btn.clicked.connect(self._load_file_into_table)
-        self.load_file_btn.setStyleSheet("""
-            QPushButton {
-                background: rgba(46, 196, 160, 0.15);
-                border: 1px solid rgba(46, 196, 160, 0.45);
-                border-radius: 6px;
-                color: #7AF0D0;
-                font-family: "Helvetica Neue", sans-serif;
-                font-size: 12px;
-                font-weight: 600;
-                padding: 4px 14px;
-            }
-            QPushButton:hover {
-                background: rgba(46, 196, 160, 0.28);
-                color: #AAFAE8;
-            }
-            QPushButton:pressed {
-                background: rgba(46, 196, 160, 0.10);
-            }
-        """)
+        self.load_file_btn.setObjectName("loadFileButton")
         tagline_row.addWidget(self.load_file_btn)
         main_content_layout.addLayout(tagline_row)
 
         url_panel = QWidget()
         url_panel.setObjectName("urlWell")
-        url_panel.setStyleSheet("""
-            QWidget#urlWell {
-                background: rgb(3, 7, 16);
-                border: 1px solid rgba(74, 144, 232, 0.22);
-                border-radius: 12px;
-            }
-        """)
         url_panel_layout = QVBoxLayout(url_panel)
         url_panel_layout.setContentsMargins(14, 14, 14, 12)
         url_panel_layout.setSpacing(8)
 
         self.url_table = URLTableWidget()
         self.url_table.itemChanged.connect(self._update_url_counter)
-        self.url_table.model().rowsInserted.connect(self._update_url_counter)
-        self.url_table.model().rowsRemoved.connect(self._update_url_counter)
+        self.url_table.model().rowsInserted.connect(self._on_url_rows_changed)
+        self.url_table.model().rowsRemoved.connect(self._on_url_rows_changed)
         self.url_table.url_activated.connect(self._open_single_url)
         self.url_table.urls_changed.connect(self._on_urls_changed)
         self.url_table.file_dropped.connect(self.load_file_from_path)
         self.url_table.setToolTip("Double-click a URL row to open it in Safari")
-        self.url_table.setStyleSheet("""
-            QTableWidget {
-                background: transparent;
-                border: none;
-                color: #F0F4FA;
-                font-size: 15px;
-                outline: none;
-                selection-background-color: transparent;
-            }
-            QTableWidget::item {
-                padding: 0px;
-                border: none;
-                background: transparent;
-            }
-            QTableWidget QLineEdit {
-                background: transparent;
-                border: none;
-                color: #F0F4FA;
-                padding-left: 16px;
-                font-size: 15px;
-                selection-background-color: rgba(110, 130, 168, 0.45);
-            }
-            QScrollBar:vertical {
-                background: transparent;
-                width: 6px;
-                margin: 4px 0;
-            }
-            QScrollBar::handle:vertical {
-                background: rgba(255, 255, 255, 0.16);
-                border-radius: 3px;
-                min-height: 24px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: rgba(255, 255, 255, 0.26);
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0px;
-            }
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
-                background: transparent;
-            }
-        """)
+        self.url_table.setObjectName("urlTable")
 
         self.url_empty_state = URLEmptyStateWidget()
         self.url_empty_state.urls_pasted.connect(self._handle_pasted_urls)
@@ -661,16 +1084,7 @@ class MainWindow(QMainWindow):
 
         self.url_counter_label = QLabel("0 URLs ready")
         self.url_counter_label.setAlignment(Qt.AlignmentFlag.AlignRight)
-        self.url_counter_label.setStyleSheet("""
-            QLabel {
-                color: #4AE89A;
-                font-size: 13px;
-                font-weight: 600;
-                letter-spacing: 0.2px;
-                padding-top: 2px;
-                padding-right: 4px;
-            }
-        """)
+        self.url_counter_label.setObjectName("urlCounter")
         main_content_layout.addWidget(self.url_counter_label)
 
         button_row = QHBoxLayout()
@@ -719,13 +1133,7 @@ class MainWindow(QMainWindow):
 
         self.status_bar = QLabel("Ready")
         self.status_bar.setAlignment(Qt.AlignmentFlag.AlignRight)
-        self.status_bar.setStyleSheet("""
-            QLabel {
-                color: #6A7890;
-                font-size: 12px;
-                padding-right: 4px;
-            }
-        """)
+        self.status_bar.setObjectName("statusBar")
         main_layout.addWidget(self.status_bar)
 
         self.safari_panel = main_content
@@ -805,10 +1213,16 @@ class MainWindow(QMainWindow):
         pass
 
     def _apply_theme(self):
-        """Glass Noir theme is static - no dynamic theming needed."""
-        # The Glass Noir design uses fixed colors defined inline in _setup_ui
-        # This method is kept for compatibility but does nothing significant
-        pass
+        """Applies the Glass Noir shell stylesheet once at the window root."""
+        # Every static shell widget is styled by objectName from this single
+        # sheet, so Qt parses and cascades one stylesheet instead of many.
+        self.setStyleSheet(_WINDOW_QSS)
+        # Popup sheets depend only on theme colors, so render them here once
+        # instead of formatting a template for every message box.
+        theme = self.current_theme
+        self._warning_box_qss = _WARNING_BOX_QSS.substitute(color=theme.safari_accent)
+        self._info_box_qss = _MESSAGE_BOX_QSS.substitute(color=theme.safari_primary)
+        self._alert_box_qss = _MESSAGE_BOX_QSS.substitute(color=theme.safari_accent)
 
     def _run_urls_in_safari(self):
         """Runs URLs from the selected Quick Save block or URL table in Safari."""
@@ -835,8 +1249,7 @@ class MainWindow(QMainWindow):
 
         urls = self.url_table.get_all_urls()
         if urls:
-            for row in range(self.url_table.rowCount()):
-                self.url_table.set_status_state(row, "opening")
+            self.url_table.set_all_status("opening")
 
             self.worker = AsyncWorker(
                 self._open_urls_with_tracking, urls, self.private_mode_enabled
@@ -966,15 +1379,13 @@ class MainWindow(QMainWindow):
             )
 
             # Update status for all URLs based on overall success
-            for row in range(self.url_table.rowCount()):
-                self.url_table.update_status(row, success)
+            self.url_table.set_all_status("opened" if success else "failed")
 
             return success
         except (TimeoutError, OSError) as e:
             logger.error("Error in URL tracking: %s", e)
             # Mark all as failed on error
-            for row in range(self.url_table.rowCount()):
-                self.url_table.update_status(row, False)
+            self.url_table.set_all_status("failed")
             return False
 
     def _on_safari_operation_complete(self, success: bool, url_count: int):
@@ -1011,9 +1422,7 @@ class MainWindow(QMainWindow):
             id="grp_" + token_hex(4),
             name=name,
             created_at=datetime.now().isoformat(timespec="seconds"),
-            items=[
-                GroupItem(title=self._generate_bookmark_name(u), url=u) for u in urls
-            ],
+            items=[GroupItem(title=self._bookmark_title(u), url=u) for u in urls],
         )
         self.group_store.upsert_group(group)
 
@@ -1074,7 +1483,10 @@ class MainWindow(QMainWindow):
             return
 
         normalized = [
-            self.url_processor._normalize_url(url) or url for url in urls
+            processed or url
+            for url, processed in zip(
+                urls, self.url_processor.normalize_urls(urls), strict=True
+            )
         ]
         entry = QuickSaveEntry(
             id="qs_" + token_hex(4),
@@ -1103,54 +1515,47 @@ class MainWindow(QMainWindow):
             f"{'s' if len(normalized) != 1 else ''} to {QUICK_SAVE_FOLDER_NAME}"
         )
 
+    def _schedule_bookmark_filter(self, _text: str) -> None:
+        """Restart the debounce timer; the filter runs once typing pauses."""
+        self._bookmark_filter_timer.start()
+
     def _filter_bookmarks(self, text: str):
         """Filters the bookmark tree based on search text."""
         search_text = text.lower().strip()
-        root = self.bookmark_tree.invisibleRootItem()
-
-        for i in range(root.childCount()):
-            folder_item = root.child(i)
-            folder_matches = search_text in folder_item.text(0).lower()
-            folder_has_visible_children = False
-
-            # Check children
-            for j in range(folder_item.childCount()):
-                bookmark_item = folder_item.child(j)
-                bookmark_matches = False
-
-                bookmark_data = bookmark_item.data(0, Qt.ItemDataRole.UserRole)
-                if bookmark_data:
-                    name = bookmark_data.get("name", "").lower()
-                    url = bookmark_data.get("url", "").lower()
-
-                    if search_text in name or search_text in url:
-                        bookmark_matches = True
-
-                # Show bookmark if:
-                # 1. Search is empty (handled by setHidden check later, but here logic is specific)
-                # 2. Bookmark matches
-                # 3. Parent folder matches (show all content of matched folder)
-                should_show_bookmark = (
-                    bookmark_matches or folder_matches or (search_text == "")
-                )
-
-                bookmark_item.setHidden(not should_show_bookmark)
+        index = self._bookmark_search_index
+        if index is None:
+            index = _BookmarkSearchIndex(self.bookmark_tree)
+            self._bookmark_search_index = index
+        # Focus changes and trailing spaces re-send the query already shown.
+        if search_text == index.last_query:
+            return
+        index.last_query = search_text
+
+        items = index.items
+        if not search_text:
+            # Clearing the search only has to reveal what the last one hid.
+            for row in index.hidden_rows:
+                items[row].setHidden(False)
+            index.hidden_rows = set()
+            return
 
-                if should_show_bookmark:
-                    folder_has_visible_children = True
+        shown = index.shown_rows(search_text)
+        hidden = index.all_rows - shown
+        # Only rows whose state flips reach Qt.
+        for row in hidden - index.hidden_rows:
+            items[row].setHidden(True)
+        for row in index.hidden_rows - hidden:
+            items[row].setHidden(False)
+        index.hidden_rows = hidden
 
-            # Show folder if:
-            # 1. Search is empty
-            # 2. Folder matches
-            # 3. Folder has visible children
-            should_show_folder = (
-                folder_matches or folder_has_visible_children or (search_text == "")
-            )
-            folder_item.setHidden(not should_show_folder)
+        # Expand the folders that stay visible while searching
+        for row in index.folder_rows:
+            if row in shown:
+                items[row].setExpanded(True)
 
-            # Expand folder if we are searching and it is visible
-            if search_text and should_show_folder:
-                folder_item.setExpanded(True)
+    def _invalidate_bookmark_search_index(self, *_args) -> None:
+        """Drop the filter index; the next keystroke rebuilds it from the tree."""
+        self._bookmark_search_index = None
 
     def _organize_urls_in_input(self):  # NEW method
         """Extracts, cleans, sorts, and reformats URLs in the table."""
@@ -1159,19 +1564,14 @@ class MainWindow(QMainWindow):
             self._show_message("No URLs found to organize.", "warning")
             return
 
-        # Clear and re-add URLs (this will clean and sort them)
-        cleaned_urls = []
-        for url in urls:
-            processed = self.url_processor._normalize_url(url)
-            if processed:
-                cleaned_urls.append(processed)
-
-        # Sort URLs alphabetically
-        cleaned_urls.sort()
+        cleaned_urls = [
+            processed
+            for processed in self.url_processor.normalize_urls(urls)
+            if processed
+        ]
 
-        # Clear table and re-add organized URLs
-        self.url_table.clear_table()
-        self.url_table.add_urls(cleaned_urls)
+        # replace_urls sorts and rebuilds the table in a single repaint.
+        self.url_table.replace_urls(cleaned_urls)
 
         logger.info("Organized %d URLs in the table.", len(cleaned_urls))
 
@@ -1181,21 +1581,7 @@ class MainWindow(QMainWindow):
         msg.setIcon(QMessageBox.Icon.Warning)
         msg.setWindowTitle("Warning")
         msg.setText(message)
-        msg.setStyleSheet(
-            f"""
-            QMessageBox {{
-                background: #1e1e1e;
-                color: #fff;
-            }}
-            QMessageBox QPushButton {{
-                background: {self.current_theme["safari"]["accent"]}; # Use accent from safari tab
-                color: #d0d0d0;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-            }}
-        """
-        )
+        msg.setStyleSheet(self._warning_box_qss)
         msg.exec()
 
     def _update_url_counter(self):
@@ -1227,6 +1613,12 @@ class MainWindow(QMainWindow):
         self._current_url_snapshot = urls.copy()
         self._update_undo_button_state()
 
+    def _on_url_rows_changed(self, *_args):
+        """Refresh the counter for single-row edits; bulk loads update once at the end."""
+        if self.url_table.is_bulk_updating():
+            return
+        self._update_url_counter()
+
     def _on_urls_changed(self, urls: list[str]):
         """Refresh derived UI state after the URL list changes."""
         self._track_url_history(urls)
@@ -1248,20 +1640,34 @@ class MainWindow(QMainWindow):
 
     def _find_or_create_folder(self, folder_name: str) -> QTreeWidgetItem:
         """Finds an existing folder in the tree or creates a new one."""
+        item = self._folder_index.get(folder_name)
+        if item is not None and self._is_top_level_folder(item, folder_name):
+            return item
+
+        # Index miss or stale entry (folder renamed, moved, or deleted): fall
+        # back to a scan, which also refreshes the index.
         root = self.bookmark_tree.invisibleRootItem()
         for i in range(root.childCount()):
             item = root.child(i)
-            data = item.data(0, Qt.ItemDataRole.UserRole)
-            if (
-                data
-                and data.get("type") == "folder"
-                and data.get("name") == folder_name
-            ):
+            if self._is_top_level_folder(item, folder_name):
+                self._folder_index[folder_name] = item
                 return item
 
         folder_data = {"name": folder_name, "type": "folder", "children": []}
         return self._create_tree_item(folder_data)
 
+    def _is_top_level_folder(self, item: QTreeWidgetItem, folder_name: str) -> bool:
+        """Return True if *item* is still a top-level folder named *folder_name*."""
+        try:
+            if item.treeWidget() is not self.bookmark_tree or item.parent() is not None:
+                return False
+            data = item.data(0, Qt.ItemDataRole.UserRole)
+        except RuntimeError:  # underlying item was deleted by Qt
+            return False
+        return bool(
+            data and data.get("type") == "folder" and data.get("name") == folder_name
+        )
+
     def _resolve_folder_style(
         self, folder_name: str, accent: str | None = None
     ) -> dict[str, str]:
@@ -1277,58 +1683,20 @@ class MainWindow(QMainWindow):
         if folder_name in self.DEFAULT_TAB_PALETTE:
             return self._style_from_accent(self.DEFAULT_TAB_PALETTE[folder_name])
 
-        fallback_styles = [
-            {
-                "start": "#5B8DEF",
-                "end": "#092B59",
-                "border": "#9AD4FF",
-                "icon": "#E8F7FF",
-            },
-            {
-                "start": "#9B7AE8",
-                "end": "#250854",
-                "border": "#D6B5FF",
-                "icon": "#F3E8FF",
-            },
-            {
-                "start": "#4DB6A0",
-                "end": "#07312B",
-                "border": "#9CE8D8",
-                "icon": "#ECFFF8",
-            },
-            {
-                "start": "#E5738A",
-                "end": "#3E081F",
-                "border": "#EAB0C9",
-                "icon": "#FFE5EF",
-            },
-            {
-                "start": "#D4A05A",
-                "end": "#4A2603",
-                "border": "#F0CB93",
-                "icon": "#FFF5D7",
-            },
-            {
-                "start": "#6B9AF5",
-                "end": "#162B67",
-                "border": "#B5C5FF",
-                "icon": "#F1F3FF",
-            },
-        ]
         if not hasattr(self, "_folder_style_cache"):
             self._folder_style_cache = {}
 
         normalized = folder_name.lower()
         if normalized not in self._folder_style_cache:
-            index = len(self._folder_style_cache) % len(fallback_styles)
-            self._folder_style_cache[normalized] = fallback_styles[index]
+            index = len(self._folder_style_cache) % len(_FALLBACK_FOLDER_STYLES)
+            self._folder_style_cache[normalized] = _FALLBACK_FOLDER_STYLES[index]
 
         return self._folder_style_cache[normalized]
 
     @staticmethod
     def _style_from_accent(hex_color: str) -> dict[str, str]:
         """Build a 4-color style dict from a single accent hex."""
-        c = QColor(hex_color)
+        c = qcolor(hex_color)
         return {
             "start": c.name().upper(),
             "end": c.darker(140).name().upper(),
@@ -1336,17 +1704,21 @@ class MainWindow(QMainWindow):
             "icon": c.lighter(150).name().upper(),
         }
 
-    def _generate_bookmark_name(self, url: str) -> str:
-        """Generates a readable name from a URL."""
+    def _bookmark_title(self, url: str) -> str:
+        """Generates a readable name for *url*, parsing it only once."""
         try:
-            domain = urlparse(url).netloc.replace("www.", "")
-            path = urlparse(url).path.strip("/")
-            if path and len(path) < 30:
-                return f"{domain.capitalize()} - {path.replace('/', ' ').title()}"
-            else:
-                return domain.capitalize()
-        except Exception:
+            netloc, path = _netloc_and_path(url)
+        except ValueError:
             return "Bookmark"
+        return self._generate_bookmark_name(netloc, path)
+
+    def _generate_bookmark_name(self, netloc: str, path: str) -> str:
+        """Generates a readable name from a URL's netloc and path."""
+        domain = netloc.removeprefix("www.")
+        path = path.strip("/")
+        if path and len(path) < 30:
+            return f"{domain.capitalize()} - {path.replace('/', ' ').title()}"
+        return domain.capitalize()
 
     def _is_quick_save_item(self, item: QTreeWidgetItem | None) -> bool:
         curr = item
@@ -1603,24 +1975,28 @@ class MainWindow(QMainWindow):
         logger.info("Bookmarks reordered and saved.")
 
     def _sync_tree_to_data(self):
-        """Rebuilds self.bookmarks from the current tree widget state."""
+        """Rebuilds self.bookmarks from the current tree widget state.
 
-        def item_to_node(item: QTreeWidgetItem) -> BookmarkNode:
-            data = item.data(0, Qt.ItemDataRole.UserRole)
-            if data.get("type") == "folder":
-                children = []
-                for i in range(item.childCount()):
-                    children.append(item_to_node(item.child(i)))
-                return BookmarkFolder(name=data["name"], children=children)
-            else:
-                return Bookmark(name=data["name"], url=data.get("url", ""))
-
-        self.bookmarks = []
-        for i in range(self.bookmark_tree.topLevelItemCount()):
-            top_level_item = self.bookmark_tree.topLevelItem(i)
-            if top_level_item is None:
-                continue
-            self.bookmarks.append(item_to_node(top_level_item))
+        Like ``_build_serialized_tree``, folders are expanded from an explicit
+        stack rather than by recursing once per item.
+        """
+        user_role = Qt.ItemDataRole.UserRole
+        bookmarks: list[BookmarkNode] = []
+        stack: deque[tuple[QTreeWidgetItem, list[BookmarkNode]]] = deque(
+            [(self.bookmark_tree.invisibleRootItem(), bookmarks)]
+        )
+        while stack:
+            parent_item, out = stack.pop()
+            for i in range(parent_item.childCount()):
+                item = parent_item.child(i)
+                data = item.data(0, user_role)
+                if data.get("type") == "folder":
+                    folder = BookmarkFolder(name=data["name"], children=[])
+                    stack.append((item, folder.children))
+                    out.append(folder)
+                else:
+                    out.append(Bookmark(name=data["name"], url=data.get("url", "")))
+        self.bookmarks = bookmarks
 
     def _get_selected_parent_item(self) -> QTreeWidgetItem | None:
         """Returns the currently selected folder item, or its parent if a bookmark is selected."""
@@ -1700,16 +2076,61 @@ class MainWindow(QMainWindow):
         self.save_bookmarks()
 
     def _create_tree_item(
-        self, data: dict[str, Any], parent: QTreeWidgetItem | None = None
+        self,
+        data: dict[str, Any],
+        parent: QTreeWidgetItem | None = None,
+        defer_attach: bool = False,
     ) -> QTreeWidgetItem:
-        """Recursive helper to build the visual tree from data."""
+        """Build the visual subtree for *data* and attach it to the tree.
+
+        Nested folders are expanded with an explicit worklist rather than
+        recursion, so deep imports cost no extra Python frames. With
+        ``defer_attach`` the item is returned detached so the caller can
+        insert many siblings with one ``addChildren``/``addTopLevelItems`` call.
+        """
+        item = self._build_tree_node(data)
+        pending: deque[tuple[QTreeWidgetItem, dict[str, Any]]] = deque([(item, data)])
+        while pending:
+            node_item, node_data = pending.pop()
+            if (
+                node_data.get("type") != "folder"
+                or node_data.get("name") == QUICK_SAVE_FOLDER_NAME
+                or "children" not in node_data
+            ):
+                continue
+            children: list[QTreeWidgetItem] = []
+            for child_data in node_data["children"]:
+                if isinstance(child_data, dict):
+                    child_item = self._build_tree_node(child_data)
+                    children.append(child_item)
+                    pending.append((child_item, child_data))
+            node_item.addChildren(children)
+
+        is_group = data.get("type") == "group"
+        if defer_attach or (is_group and parent is None):
+            # Group markers are only meaningful as children of folders.
+            return item
+
+        if parent:
+            parent.addChild(item)
+        else:
+            self.bookmark_tree.addTopLevelItem(item)
+            if data.get("type") == "folder":
+                self._folder_index[data["name"]] = item
+
+        return item
+
+    def _build_tree_node(self, data: dict[str, Any]) -> QTreeWidgetItem:
+        """Create and style a single detached tree item for *data*."""
         is_folder = data.get("type") == "folder"
         is_group = data.get("type") == "group"
-        is_quick_save_folder = is_folder and data.get("name") == QUICK_SAVE_FOLDER_NAME
         item = QTreeWidgetItem([data.get("name", "(missing group)")])
         # Keep a deep-enough copy so Quick Save children live on the item,
         # not as expandable sidebar rows.
         item.setData(0, Qt.ItemDataRole.UserRole, dict(data))
+        if not is_folder:
+            # Lowercased once here instead of on every filter index rebuild.
+            item.setData(0, _SEARCH_TEXT_ROLE, _bookmark_search_text(data))
         if is_folder:
             folder_style = self._resolve_folder_style(
                 data["name"],
@@ -1717,14 +2138,10 @@ class MainWindow(QMainWindow):
             )
             item.setData(0, Qt.ItemDataRole.UserRole + 1, folder_style)
             item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            if is_quick_save_folder:
+            if data.get("name") == QUICK_SAVE_FOLDER_NAME:
                 item.setChildIndicatorPolicy(
                     QTreeWidgetItem.ChildIndicatorPolicy.DontShowIndicator
                 )
-            elif "children" in data:
-                for child_data in data["children"]:
-                    if isinstance(child_data, dict):
-                        self._create_tree_item(child_data, item)
         elif is_group:
             item.setData(
                 0,
@@ -1740,47 +2157,55 @@ class MainWindow(QMainWindow):
             )
         else:
             item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-
-        if is_group and parent is None:
-            # Group markers are only meaningful as children of folders.
-            return item
-
-        if parent:
-            parent.addChild(item)
-        else:
-            self.bookmark_tree.addTopLevelItem(item)
-
         return item
 
     def save_bookmarks(self):
+        """Schedules a save of the bookmark tree, coalescing rapid edits."""
+        self._bookmark_save_timer.start()
+
+    def _save_bookmarks_now(self):
         """Saves the entire hierarchical tree structure to file."""
-        data = []
-        root = self.bookmark_tree.invisibleRootItem()
-        for i in range(root.childCount()):
-            data.append(self._serialize_item(root.child(i)))
-        bookmark_nodes = [self.bookmark_manager._deserialize_node(d) for d in data]
+        self._bookmark_save_timer.stop()
+        deserialize = self.bookmark_manager._deserialize_node
+        bookmark_nodes = [deserialize(d) for d in self._build_serialized_tree()]
         self.bookmark_manager.save_bookmarks(bookmark_nodes)
 
-    def _serialize_item(self, item: QTreeWidgetItem) -> dict[str, Any]:
-        """Recursively converts a tree item back into a dictionary for saving."""
-        data = (item.data(0, Qt.ItemDataRole.UserRole) or {}).copy()
-        if data.get("type") == "folder":
-            if data.get("name") == QUICK_SAVE_FOLDER_NAME:
-                data["children"] = [
-                    dict(child)
-                    for child in (data.get("children") or [])
-                    if isinstance(child, dict)
-                ]
-            else:
-                data["children"] = [
-                    self._serialize_item(item.child(i))
-                    for i in range(item.childCount())
-                ]
-        return data
+    def _build_serialized_tree(self) -> list[dict[str, Any]]:
+        """Converts the whole tree back into nested dictionaries for saving.
+
+        Walks the tree with an explicit stack instead of recursing per item.
+        Only folders are copied (to attach ``children``); leaf dicts are used
+        as returned by ``item.data`` since consumers only read them.
+        """
+        user_role = Qt.ItemDataRole.UserRole
+        result: list[dict[str, Any]] = []
+        stack: deque[tuple[QTreeWidgetItem, list[dict[str, Any]]]] = deque(
+            [(self.bookmark_tree.invisibleRootItem(), result)]
+        )
+        while stack:
+            parent_item, out = stack.pop()
+            for i in range(parent_item.childCount()):
+                item = parent_item.child(i)
+                data = item.data(0, user_role) or {}
+                if data.get("type") == "folder":
+                    data = dict(data)
+                    if data.get("name") == QUICK_SAVE_FOLDER_NAME:
+                        data["children"] = [
+                            dict(child)
+                            for child in (data.get("children") or [])
+                            if isinstance(child, dict)
+                        ]
+                    else:
+                        data["children"] = []
+                        stack.append((item, data["children"]))
+                out.append(data)
+        return result
 
     def load_bookmarks(self):
         """Loads the hierarchical bookmark structure from file and populates the tree."""
-        self.bookmark_tree.clear()
+        if self._bookmark_save_timer.isActive():
+            # Write out pending edits first so the reload sees them.
+            self._save_bookmarks_now()
         bookmark_nodes = self.bookmark_manager.load_bookmarks()
 
         bookmark_nodes, changed = self._normalize_bookmark_nodes(bookmark_nodes)
@@ -1788,13 +2213,27 @@ class MainWindow(QMainWindow):
             self.bookmark_manager.save_bookmarks(bookmark_nodes)
 
         bookmark_nodes.sort(key=self._bookmark_sort_key)
+        top_items: list[QTreeWidgetItem] = []
         for node in bookmark_nodes:
             node_data = self.bookmark_manager._serialize_node(node)
-            item = self._create_tree_item(node_data)
-            if node_data.get("name") == QUICK_SAVE_FOLDER_NAME:
-                item.setExpanded(False)
-            else:
-                item.setExpanded(True)
+            if node_data.get("type") == "group":
+                # Group markers are only meaningful as children of folders.
+                continue
+            top_items.append(self._create_tree_item(node_data, defer_attach=True))
+
+        # Build detached, then attach in one call so the view lays out once.
+        self.bookmark_tree.setUpdatesEnabled(False)
+        try:
+            self.bookmark_tree.clear()
+            self.bookmark_tree.addTopLevelItems(top_items)
+            self._folder_index.clear()
+            for item in top_items:
+                data = item.data(0, Qt.ItemDataRole.UserRole) or {}
+                if data.get("type") == "folder":
+                    self._folder_index[data["name"]] = item
+                item.setExpanded(data.get("name") != QUICK_SAVE_FOLDER_NAME)
+        finally:
+            self.bookmark_tree.setUpdatesEnabled(True)
 
     def _normalize_bookmark_nodes(
         self, bookmark_nodes: list[BookmarkNode]
@@ -1917,19 +2356,14 @@ class MainWindow(QMainWindow):
         )
 
     def _bookmark_sort_key(self, node: BookmarkNode) -> tuple[int, int, str]:
-        preferred_order = {
-            name.lower(): index
-            for index, name in enumerate(
-                (QUICK_SAVE_FOLDER_NAME, *DEFAULT_BOOKMARK_FOLDER_NAMES)
-            )
-        }
         if isinstance(node, dict):
             folder_name = str(node.get("name", "")).lower()
         else:
             folder_name = node.name.lower()
-        group = 0 if folder_name in preferred_order else 1
-        order = preferred_order.get(folder_name, 999)
-        return group, order, folder_name
+        order = _BOOKMARK_FOLDER_ORDER.get(folder_name)
+        if order is None:
+            return 1, 999, folder_name
+        return 0, order, folder_name
 
     def _show_bookmark_context_menu(self, position):
         """Shows a context menu for folder, bookmark, and group items."""
@@ -1938,36 +2372,18 @@ class MainWindow(QMainWindow):
             return
 
         menu = QMenu(self)
-        # Apply theme styling to the context menu
-        menu.setStyleSheet(
-            """
-            QMenu {
-                background-color: #1C1F27;
-                color: #E8ECF4;
-                border: 1px solid rgba(255, 255, 255, 0.10);
-                border-radius: 8px;
-                padding: 4px;
-            }
-            QMenu::item {
-                padding: 6px 16px;
-                border-radius: 4px;
-            }
-            QMenu::item:selected {
-                background-color: rgba(91, 141, 239, 0.28);
-                color: #E8ECF4;
-            }
-            """
-        )
+        # Styled by the root window sheet (see _WINDOW_QSS)
+        menu.setObjectName("bookmarkMenu")
 
         data = item.data(0, Qt.ItemDataRole.UserRole)
         item_type = data.get("type") if data else None
 
         if item_type == "group":
             open_action = menu.addAction("Open in Safari")
-            open_action.triggered.connect(lambda: self._open_group_in_safari(item))
+            open_action.triggered.connect(partial(self._open_group_in_safari, item))
             menu.addSeparator()
             rename_action = menu.addAction("Rename")
-            rename_action.triggered.connect(lambda: self._rename_group(item))
+            rename_action.triggered.connect(partial(self._rename_group, item))
             move_menu = menu.addMenu("Move to…")
             parent = item.parent()
             current_folder_name = parent.text(0) if parent else ""
@@ -1978,20 +2394,18 @@ class MainWindow(QMainWindow):
                 folder_data = folder_item.data(0, Qt.ItemDataRole.UserRole)
                 if folder_data and folder_data.get("name") != current_folder_name:
                     move_menu.addAction(folder_data["name"]).triggered.connect(
-                        lambda checked=False, fi=folder_item: self._move_group_to(
-                            item, fi
-                        )
+                        partial(self._move_group_to, item, folder_item)
                     )
             menu.addSeparator()
             delete_action = menu.addAction("Delete")
-            delete_action.triggered.connect(lambda: self._delete_group(item))
+            delete_action.triggered.connect(partial(self._delete_group, item))
         elif item_type == "bookmark":
             open_action = menu.addAction("Open in Safari")
-            open_action.triggered.connect(lambda: self._open_bookmark_link(item))
+            open_action.triggered.connect(partial(self._open_bookmark_link, item))
             menu.addSeparator()
 
             rename_action = menu.addAction("Rename")
-            rename_action.triggered.connect(lambda: self.bookmark_tree.editItem(item))
+            rename_action.triggered.connect(partial(self.bookmark_tree.editItem, item))
 
             color_menu = menu.addMenu("Color")
             for hex_ in [
@@ -2007,32 +2421,32 @@ class MainWindow(QMainWindow):
                 "#6B6B7A",
             ]:
                 color_menu.addAction(hex_.upper()).triggered.connect(
-                    lambda checked=False, h=hex_: self._set_bookmark_accent(item, h)
+                    partial(self._set_bookmark_accent, item, hex_)
                 )
 
             copy_action = menu.addAction("Copy URL")
-            copy_action.triggered.connect(lambda: self._copy_bookmark_url(item))
+            copy_action.triggered.connect(partial(self._copy_bookmark_url, item))
             menu.addSeparator()
 
             delete_action = menu.addAction("Delete")
-            delete_action.triggered.connect(lambda: self._delete_bookmark_item(item))
+            delete_action.triggered.connect(partial(self._delete_bookmark_item, item))
         else:
             # Folder (or other top-level) menu
             folder_name = (data or {}).get("name", "")
             if folder_name == QUICK_SAVE_FOLDER_NAME:
                 open_action = menu.addAction("Open Quick Save")
                 open_action.triggered.connect(
-                    lambda: self._show_quick_save_view(item)
+                    partial(self._show_quick_save_view, item)
                 )
                 menu.exec(self.bookmark_tree.viewport().mapToGlobal(position))
                 return
 
             edit_action = menu.addAction("Rename")
-            edit_action.triggered.connect(lambda: self.bookmark_tree.editItem(item))
+            edit_action.triggered.connect(partial(self.bookmark_tree.editItem, item))
             menu.addSeparator()
 
             delete_action = menu.addAction("Delete")
-            delete_action.triggered.connect(lambda: self._delete_bookmark_item(item))
+            delete_action.triggered.connect(partial(self._delete_bookmark_item, item))
 
         menu.exec(self.bookmark_tree.viewport().mapToGlobal(position))
 
@@ -2136,12 +2550,21 @@ class MainWindow(QMainWindow):
         if data and data.get("type") == "bookmark":
             url = data.get("url")
             if url:
-                self.worker = AsyncWorker(
-                    self._open_bookmark_in_existing_window,
-                    [url],
-                    self.private_mode_enabled,
-                )
-                self.worker.start()
+                self._pending_bookmark_urls.append(url)
+                self._bookmark_flush_timer.start()
+
+    def _flush_pending_bookmark_urls(self) -> None:
+        """Open every bookmark URL queued since the last flush in one call."""
+        if not self._pending_bookmark_urls:
+            return
+        urls = list(dict.fromkeys(self._pending_bookmark_urls))
+        self._pending_bookmark_urls.clear()
+        self.worker = AsyncWorker(
+            self._open_bookmark_in_existing_window,
+            urls,
+            self.private_mode_enabled,
+        )
+        self.worker.start()
 
     async def _open_bookmark_in_existing_window(
         self, urls: list[str], private_mode: bool = True
@@ -2256,26 +2679,31 @@ class MainWindow(QMainWindow):
 
     def _export_bookmarks(self):
         """Exports all bookmarks to a JSON file."""
-        data = []
-        root = self.bookmark_tree.invisibleRootItem()
-        for i in range(root.childCount()):
-            data.append(self._serialize_item(root.child(i)))
+        data = self._build_serialized_tree()
 
         file_path, _ = QFileDialog.getSaveFileName(
             self, "Export Bookmarks", "", "JSON Files (*.json);;All Files (*)"
         )
 
         if file_path:
-            try:
-                with open(file_path, "w", encoding="utf-8") as f:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
-                QMessageBox.information(
+            # Encode and write off the GUI thread; large trees no longer block.
+            self.export_worker = AsyncWorker(self._write_json_export, file_path, data)
+            self.export_worker.result_ready.connect(
+                lambda _result: QMessageBox.information(
                     self, "Success", "Bookmarks exported successfully!"
                 )
-            except Exception as e:
-                QMessageBox.critical(
-                    self, "Error", f"Failed to export bookmarks: {str(e)}"
+            )
+            self.export_worker.error.connect(
+                lambda err: QMessageBox.critical(
+                    self, "Error", f"Failed to export bookmarks: {err}"
                 )
+            )
+            self.export_worker.start()
+
+    @staticmethod
+    async def _write_json_export(file_path: str, data: list[dict[str, Any]]) -> None:
+        """Write exported bookmark data as indented UTF-8 JSON."""
+        Path(file_path).write_bytes(dumps_pretty(data))
 
     def _load_window_state(self):
         """Loads window geometry and state from settings."""
@@ -2291,18 +2719,16 @@ class MainWindow(QMainWindow):
 
     def closeEvent(self, event):  # noqa: N802 - Qt override
         """Saves window state before closing."""
-        self.settings.setValue("mainWindow/geometry", self.saveGeometry())
-        self.settings.setValue("mainWindow/state", self.saveState())
+        self._set_setting("mainWindow/geometry", self.saveGeometry())
+        self._set_setting("mainWindow/state", self.saveState())
+        self._flush_settings()
+        if self._bookmark_save_timer.isActive():
+            self._save_bookmarks_now()
         super().closeEvent(event)
 
-    def _hex_to_rgb(self, hex_color: str) -> str:
-        """Converts a hex color string to an RGB string for rgba() CSS functions."""
-        hex_color = hex_color.lstrip("#")
-        return f"{int(hex_color[0:2], 16)}, {int(hex_color[2:4], 16)}, {int(hex_color[4:6], 16)}"
-
     def _load_file_into_table(self):
         """Open a file dialog and load URLs from a .txt/.csv/.md file."""
-        last_dir = str(self.settings.value("richLinks/lastDir", ""))
+        last_dir = str(self._get_setting("richLinks/lastDir", ""))
         file_path, _ = QFileDialog.getOpenFileName(
             self,
             "Load URL File",
@@ -2312,7 +2738,7 @@ class MainWindow(QMainWindow):
         if not file_path:
             return
 
-        self.settings.setValue("richLinks/lastDir", str(Path(file_path).parent))
+        self._set_setting("richLinks/lastDir", str(Path(file_path).parent))
 
         try:
             lines = self.link_converter.load(file_path)
@@ -2343,10 +2769,10 @@ class MainWindow(QMainWindow):
             return
 
         # Apply options from QSettings
-        skip_dupes = bool(self.settings.value("richLinks/skipDuplicates", True, type=bool))
-        sort_alpha = bool(self.settings.value("richLinks/sortAlpha", False, type=bool))
+        skip_dupes = bool(self._get_setting("richLinks/skipDuplicates", True, bool))
+        sort_alpha = bool(self._get_setting("richLinks/sortAlpha", False, bool))
         preserve_blanks = bool(
-            self.settings.value("richLinks/preserveBlanks", True, type=bool)
+            self._get_setting("richLinks/preserveBlanks", True, bool)
         )
 
         parsed = self.link_converter.parse_lines(urls)
@@ -2375,49 +2801,34 @@ class MainWindow(QMainWindow):
     def _show_rich_links_options(self, position):
         """Show a context menu with toggleable options for Copy Rich Links."""
         menu = QMenu(self)
-        menu.setStyleSheet("""
-            QMenu {
-                background-color: #1C1F27;
-                color: #E8ECF4;
-                border: 1px solid rgba(255, 255, 255, 0.10);
-                border-radius: 8px;
-                padding: 4px;
-            }
-            QMenu::item {
-                padding: 6px 16px;
-                border-radius: 4px;
-            }
-            QMenu::item:selected {
-                background-color: rgba(46, 196, 160, 0.28);
-                color: #E8ECF4;
-            }
-        """)
+        # Styled by the root window sheet (see _WINDOW_QSS)
+        menu.setObjectName("richLinksMenu")
 
-        skip_dupes = bool(self.settings.value("richLinks/skipDuplicates", True, type=bool))
-        sort_alpha = bool(self.settings.value("richLinks/sortAlpha", False, type=bool))
+        skip_dupes = bool(self._get_setting("richLinks/skipDuplicates", True, bool))
+        sort_alpha = bool(self._get_setting("richLinks/sortAlpha", False, bool))
         preserve_blanks = bool(
-            self.settings.value("richLinks/preserveBlanks", True, type=bool)
+            self._get_setting("richLinks/preserveBlanks", True, bool)
         )
 
         skip_action = menu.addAction("Skip Duplicate URLs")
         skip_action.setCheckable(True)
         skip_action.setChecked(skip_dupes)
         skip_action.triggered.connect(
-            lambda checked: self.settings.setValue("richLinks/skipDuplicates", checked)
+            lambda checked: self._set_setting("richLinks/skipDuplicates", checked)
         )
 
         sort_action = menu.addAction("Sort Alphabetically")
         sort_action.setCheckable(True)
         sort_action.setChecked(sort_alpha)
         sort_action.triggered.connect(
-            lambda checked: self.settings.setValue("richLinks/sortAlpha", checked)
+            lambda checked: self._set_setting("richLinks/sortAlpha", checked)
         )
 
         blanks_action = menu.addAction("Preserve Blank Lines")
         blanks_action.setCheckable(True)
         blanks_action.setChecked(preserve_blanks)
         blanks_action.triggered.connect(
-            lambda checked: self.settings.setValue("richLinks/preserveBlanks", checked)
+            lambda checked: self._set_setting("richLinks/preserveBlanks", checked)
         )
 
         menu.exec(self.mapToGlobal(position))
@@ -2458,13 +2869,8 @@ class MainWindow(QMainWindow):
         """Shows a styled QMessageBox."""
         msg = QMessageBox(self)
         msg.setText(message)
-        # Use appropriate accent color for messages, typically from the Safari tab context
-        color = (
-            self.current_theme["safari"]["primary"]
-            if level == "info"
-            else self.current_theme["safari"]["accent"]
-        )
+        # Info uses the Safari primary color; everything else uses its accent.
         msg.setStyleSheet(
-            f"background-color: #1e1e1e; color: #fff; QPushButton {{ background-color: {color}; color: #fff; padding: 5px 10px; border-radius: 4px; }}"
+            self._info_box_qss if level == "info" else self._alert_box_qss
         )
         msg.exec()
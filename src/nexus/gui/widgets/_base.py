@@ -1,7 +1,7 @@
 """Custom UI widgets for the Nexus application."""
 
 import re
-from typing import cast
+from typing import Final, cast
 
 from PySide6.QtCore import (
     QEasingCurve,
@@ -9,6 +9,7 @@ from PySide6.QtCore import (
     QPoint,
     QPropertyAnimation,
     QRectF,
+    QSignalBlocker,
     QSize,
     Qt,
     Signal,
@@ -42,10 +43,17 @@ from PySide6.QtWidgets import (
 )
 
 from nexus.core.config import Config
+from nexus.utils.color_helpers import qcolor
 from nexus.utils.url_processor import URLProcessor
 from razorcore.threading import AsyncTaskWorker
 
 
+STATUS_READY: Final = "ready"
+STATUS_OPENING: Final = "opening"
+STATUS_OPENED: Final = "opened"
+STATUS_FAILED: Final = "failed"
+
+
 class AsyncWorker(AsyncTaskWorker):
     """Nexus async worker on razorcore.AsyncTaskWorker with result_ready alias."""
 
@@ -448,12 +456,12 @@ class BookmarkTreeDelegate(QStyledItemDelegate):
 
         if is_folder:
             style = index.data(Qt.ItemDataRole.UserRole + 1) or {}
-            accent = QColor(style.get("start", "#5B8DEF"))
-            fill = QColor("#08101C")
+            accent = qcolor(style.get("start", "#5B8DEF"))
+            fill = qcolor("#08101C")
             border = QColor(accent.red(), accent.green(), accent.blue(), 70)
 
             if selected or hovered:
-                fill = QColor("#0E1828")
+                fill = qcolor("#0E1828")
                 border = QColor(accent.red(), accent.green(), accent.blue(), 150)
 
             pill_rect = rect.adjusted(0, 2, 0, -2)
@@ -477,7 +485,7 @@ class BookmarkTreeDelegate(QStyledItemDelegate):
             font.setPointSize(14)
             font.setWeight(QFont.Weight.DemiBold)
             painter.setFont(font)
-            painter.setPen(QColor("#F0F4FA"))
+            painter.setPen(qcolor("#F0F4FA"))
             painter.drawText(
                 text_rect,
                 Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft,
@@ -486,7 +494,7 @@ class BookmarkTreeDelegate(QStyledItemDelegate):
         elif data.get("type") == "group":
             # Indented group row: small accent dot + name + optional count.
             style = index.data(Qt.ItemDataRole.UserRole + 1) or {}
-            accent = QColor(style.get("start", "#5B8DEF"))
+            accent = qcolor(style.get("start", "#5B8DEF"))
             text_rect = rect.adjusted(22, 0, -10, 0)
             if hovered or selected:
                 painter.setPen(Qt.PenStyle.NoPen)
@@ -506,7 +514,7 @@ class BookmarkTreeDelegate(QStyledItemDelegate):
             font.setPointSize(13)
             font.setWeight(QFont.Weight.Normal)
             painter.setFont(font)
-            painter.setPen(QColor("#B8C4D8"))
+            painter.setPen(qcolor("#B8C4D8"))
             painter.drawText(
                 text_rect,
                 Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft,
@@ -517,7 +525,7 @@ class BookmarkTreeDelegate(QStyledItemDelegate):
             count = data.get("count")
             if count:
                 badge_text = f"({count})"
-                painter.setPen(QColor("#8EA0BC"))
+                painter.setPen(qcolor("#8EA0BC"))
                 badge_rect = rect.adjusted(rect.width() - 44, 0, -4, 0)
                 painter.drawText(
                     badge_rect,
@@ -544,14 +552,14 @@ class BookmarkTreeDelegate(QStyledItemDelegate):
                 dot_rect.setWidth(8)
                 dot_rect.moveTop(text_rect.top() + (text_rect.height() - 8) // 2)
                 painter.setPen(Qt.PenStyle.NoPen)
-                painter.setBrush(QColor(accent_hex))
+                painter.setBrush(qcolor(accent_hex))
                 painter.drawEllipse(dot_rect)
                 text_rect.adjust(14, 0, 0, 0)
             font = option.font
             font.setPointSize(13)
             font.setWeight(QFont.Weight.Normal)
             painter.setFont(font)
-            painter.setPen(QColor("#B8C4D8"))
+            painter.setPen(qcolor("#B8C4D8"))
             painter.drawText(
                 text_rect,
                 Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft,
@@ -605,10 +613,10 @@ class NeonURLItemDelegate(QStyledItemDelegate):
     """Paints URL rows as clean list items with status indicators."""
 
     STATE_COLORS = {
-        "ready": QColor("#4AE89A"),
-        "opening": QColor("#FFD166"),
-        "opened": QColor("#3DDB88"),
-        "failed": QColor("#FF6B6B"),
+        STATUS_READY: QColor("#4AE89A"),
+        STATUS_OPENING: QColor("#FFD166"),
+        STATUS_OPENED: QColor("#3DDB88"),
+        STATUS_FAILED: QColor("#FF6B6B"),
     }
 
     def paint(self, painter, option, index):  # noqa: ANN001
@@ -635,16 +643,16 @@ class NeonURLItemDelegate(QStyledItemDelegate):
             font.setPointSize(14)
             font.setWeight(QFont.Weight.Medium)
             painter.setFont(font)
-            painter.setPen(QColor("#F0F4FA"))
+            painter.setPen(qcolor("#F0F4FA"))
             painter.drawText(
                 row_rect.adjusted(12, 0, -8, 0),
                 Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft,
                 str(index.data(Qt.ItemDataRole.DisplayRole)),
             )
         else:
-            status_state = index.data(Qt.ItemDataRole.UserRole) or "ready"
+            status_state = index.data(Qt.ItemDataRole.UserRole) or STATUS_READY
             status_label = str(index.data(Qt.ItemDataRole.DisplayRole))
-            status_color = self.STATE_COLORS.get(status_state, QColor("#6BCB8B"))
+            status_color = self.STATE_COLORS.get(status_state, qcolor("#6BCB8B"))
 
             font = option.font
             font.setPointSize(13)
@@ -663,7 +671,7 @@ class NeonURLItemDelegate(QStyledItemDelegate):
             painter.setPen(Qt.PenStyle.NoPen)
             painter.drawEllipse(dot_x - 3, int(dot_y) - 3, 6, 6)
 
-            painter.setPen(QColor("#D0DAEA"))
+            painter.setPen(qcolor("#D0DAEA"))
             painter.drawText(
                 row_rect.adjusted(group_left + 14 - row_rect.left(), 0, -10, 0),
                 Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft,
@@ -686,10 +694,10 @@ class URLTableWidget(QTableWidget):
     file_dropped = Signal(str)
 
     STATUS_LABELS = {
-        "ready": "Ready",
-        "opening": "Opening",
-        "opened": "Opened",
-        "failed": "Failed",
+        STATUS_READY: "Ready",
+        STATUS_OPENING: "Opening",
+        STATUS_OPENED: "Opened",
+        STATUS_FAILED: "Failed",
     }
 
     def __init__(self, parent=None):
@@ -700,6 +708,8 @@ class URLTableWidget(QTableWidget):
         )
         self.url_counter = 0
         self._suspend_url_events = False
+        self._bulk_depth = 0
+        self._bulk_blocker: QSignalBlocker | None = None
 
         # Setup table structure
         self.setColumnCount(3)
@@ -748,7 +758,7 @@ class URLTableWidget(QTableWidget):
 
     def update_status(self, row: int, success: bool):
         """Update the status of a URL row."""
-        self.set_status_state(row, "opened" if success else "failed")
+        self.set_status_state(row, STATUS_OPENED if success else STATUS_FAILED)
 
     def set_status_state(self, row: int, state: str):
         """Set the visual status for a row."""
@@ -758,6 +768,23 @@ class URLTableWidget(QTableWidget):
                 status_item.setText(self.STATUS_LABELS.get(state, "Ready"))
                 status_item.setData(Qt.ItemDataRole.UserRole, state)
 
+    def set_all_status(self, state: str):
+        """Set the visual status for every row with a single repaint."""
+        label = self.STATUS_LABELS.get(state, "Ready")
+        role = Qt.ItemDataRole.UserRole
+        self.setUpdatesEnabled(False)
+        blocker = QSignalBlocker(self)
+        try:
+            for row in range(self.rowCount()):
+                status_item = self.item(row, 2)
+                if status_item:
+                    status_item.setText(label)
+                    status_item.setData(role, state)
+        finally:
+            blocker.unblock()
+            self.setUpdatesEnabled(True)
+        self.viewport().update()
+
     def get_all_urls(self) -> list[str]:
         """Get all URLs from the table."""
         urls = []
@@ -767,46 +794,72 @@ class URLTableWidget(QTableWidget):
                 urls.append(url_item.text())
         return urls
 
+    def bulk_begin(self):
+        """Start a bulk update; per-row widget signals are held until ``bulk_end``."""
+        if self._bulk_depth == 0:
+            self._suspend_url_events = True
+            self._bulk_blocker = QSignalBlocker(self)
+        self._bulk_depth += 1
+
+    def bulk_end(self):
+        """Finish a bulk update and emit a single ``urls_changed``."""
+        if self._bulk_depth == 0:
+            return
+        self._bulk_depth -= 1
+        if self._bulk_depth == 0:
+            if self._bulk_blocker is not None:
+                self._bulk_blocker.unblock()
+                self._bulk_blocker = None
+            self._suspend_url_events = False
+            self._emit_urls_changed()
+
+    def is_bulk_updating(self) -> bool:
+        """Return True while a ``bulk_begin``/``bulk_end`` block is open."""
+        return self._bulk_depth > 0
+
     def clear_table(self):
         """Clear all URLs and reset counter."""
-        self._suspend_url_events = True
+        self.bulk_begin()
         self.setRowCount(0)
         self.url_counter = 0
-        self._suspend_url_events = False
-        self._emit_urls_changed()
+        self.bulk_end()
 
     def replace_urls(self, urls: list[str]):
         """Replace the table contents with a fresh URL list sorted alphabetically."""
-        self._suspend_url_events = True
-        self.setRowCount(0)
-        self.url_counter = 0
         sorted_urls = sorted([u.strip() for u in urls if u.strip()], key=lambda s: s.lower())
-        for url in sorted_urls:
-            self.url_counter += 1
-            row = self.rowCount()
-            self.insertRow(row)
-            self.setRowHeight(row, 44)
-
-            number_item = QTableWidgetItem(str(self.url_counter))
-            number_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            number_item.setFlags(Qt.ItemFlag.ItemIsEnabled)
-            self.setItem(row, 0, number_item)
-
-            url_item = QTableWidgetItem(url)
-            url_item.setFlags(
-                Qt.ItemFlag.ItemIsEnabled
-                | Qt.ItemFlag.ItemIsSelectable
-                | Qt.ItemFlag.ItemIsEditable
-            )
-            self.setItem(row, 1, url_item)
-
-            status_item = QTableWidgetItem()
-            status_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            status_item.setFlags(Qt.ItemFlag.ItemIsEnabled)
-            self.setItem(row, 2, status_item)
-            self.set_status_state(row, "ready")
-        self._suspend_url_events = False
-        self._emit_urls_changed()
+        ready_label = self.STATUS_LABELS[STATUS_READY]
+        url_flags = (
+            Qt.ItemFlag.ItemIsEnabled
+            | Qt.ItemFlag.ItemIsSelectable
+            | Qt.ItemFlag.ItemIsEditable
+        )
+        self.bulk_begin()
+        self.setUpdatesEnabled(False)
+        try:
+            # Drop the old rows, then allocate every new row in one call.
+            self.setRowCount(0)
+            self.setRowCount(len(sorted_urls))
+            for row, url in enumerate(sorted_urls):
+                self.setRowHeight(row, 44)
+
+                number_item = QTableWidgetItem(str(row + 1))
+                number_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                number_item.setFlags(Qt.ItemFlag.ItemIsEnabled)
+                self.setItem(row, 0, number_item)
+
+                url_item = QTableWidgetItem(url)
+                url_item.setFlags(url_flags)
+                self.setItem(row, 1, url_item)
+
+                status_item = QTableWidgetItem(ready_label)
+                status_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                status_item.setFlags(Qt.ItemFlag.ItemIsEnabled)
+                status_item.setData(Qt.ItemDataRole.UserRole, STATUS_READY)
+                self.setItem(row, 2, status_item)
+            self.url_counter = len(sorted_urls)
+        finally:
+            self.setUpdatesEnabled(True)
+            self.bulk_end()
 
     _FILE_DROP_EXTENSIONS = {".txt", ".csv", ".md"}
 
@@ -232,23 +232,8 @@ class QuickSaveBlock(QFrame):
 
     def _show_context_menu(self, position) -> None:
         menu = QMenu(self)
-        menu.setStyleSheet("""
-            QMenu {
-                background-color: #1C1F27;
-                color: #E8ECF4;
-                border: 1px solid rgba(255, 255, 255, 0.10);
-                border-radius: 8px;
-                padding: 4px;
-            }
-            QMenu::item {
-                padding: 6px 16px;
-                border-radius: 4px;
-            }
-            QMenu::item:selected {
-                background-color: rgba(46, 196, 160, 0.28);
-                color: #E8ECF4;
-            }
-        """)
+        # Styled by the main window's root sheet, shared with its menus.
+        menu.setObjectName("quickSaveMenu")
         copy_action = menu.addAction("Copy Bookmarks")
         paste_out_action = menu.addAction("Paste Bookmarks to URL Table")
         menu.addSeparator()
@@ -8,6 +8,7 @@ hierarchical bookmarks, and Safari automation.
 import sys
 from pathlib import Path
 
+from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import QApplication
 
 from nexus.core.config import Config, setup_logging
@@ -20,6 +21,23 @@ from razorcore.appinfo import print_startup_info
 # (see ``tests/test_main.py``) without re-running filesystem traversal.
 _PACKAGE_DIR = Path(__file__).resolve().parent
 
+# Canonical app icon, resolved once via get_resource_path() so it works in
+# development and in the PyInstaller bundle.
+_ICON_PATH = Path(get_resource_path("assets/icons/Nexus.icns"))
+
+if sys.platform == "darwin":
+    try:
+        import AppKit
+    except ImportError:  # pragma: no cover - PyObjC not available
+        _NSApplication = None
+        _NSImage = None
+    else:
+        _NSApplication = getattr(AppKit, "NSApplication", None)
+        _NSImage = getattr(AppKit, "NSImage", None)
+else:
+    _NSApplication = None
+    _NSImage = None
+
 
 def main():
     setup_logging()
@@ -32,34 +50,21 @@ def main():
     # Set app icon. Skipped when ``app`` is a test double (lacks the
     # ``setWindowIcon`` shiboken slot) so unit tests can drive ``main()``.
     is_qt_app = type(app).__name__ == "QApplication"
-    icon_path = Path(get_resource_path("assets/icons/Nexus.icns"))
+    icon_path = _ICON_PATH
     if is_qt_app and icon_path.exists():
         try:
-            from PySide6.QtGui import QIcon
-
             app.setWindowIcon(QIcon(str(icon_path)))
         except (TypeError, RuntimeError):
             # Icon setting is purely cosmetic — never fail the launch.
             pass
 
-        # macOS: Set Dock icon when running from source
-        if sys.platform == "darwin":
-            try:
-                import AppKit
-
-                ns_application = getattr(AppKit, "NSApplication", None)
-                ns_image_cls = getattr(AppKit, "NSImage", None)
-                if ns_application is None or ns_image_cls is None:
-                    raise ImportError("AppKit dock APIs unavailable")
-
-                ns_app = ns_application.sharedApplication()
-                ns_image = ns_image_cls.alloc().initWithContentsOfFile_(
-                    str(icon_path)
-                )
-                if ns_image:
-                    ns_app.setApplicationIconImage_(ns_image)
-            except ImportError:
-                pass  # PyObjC not available, skip dock icon
+        # macOS: Set Dock icon when running from source (skipped when
+        # PyObjC's AppKit dock APIs are unavailable)
+        if _NSApplication is not None and _NSImage is not None:
+            ns_app = _NSApplication.sharedApplication()
+            ns_image = _NSImage.alloc().initWithContentsOfFile_(str(icon_path))
+            if ns_image:
+                ns_app.setApplicationIconImage_(ns_image)
 
     window = MainWindow()
 
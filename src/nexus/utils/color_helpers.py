@@ -0,0 +1,15 @@
+"""Shared color parsing helpers."""
+
+from functools import lru_cache
+
+from PySide6.QtGui import QColor
+
+
+@lru_cache(maxsize=128)
+def qcolor(hex_str: str) -> QColor:
+    """Return a cached QColor for a color string such as ``"#5B8DEF"``.
+
+    The same instance is handed to every caller, so treat it as read-only and
+    copy it (``QColor(qcolor(x))``) before mutating.
+    """
+    return QColor(hex_str)
@@ -0,0 +1,39 @@
+"""JSON encoding helpers with an optional orjson fast path."""
+
+import json
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+
+def dumps_pretty(data: Any) -> bytes:
+    """Serialize *data* as UTF-8, two-space-indented JSON bytes.
+
+    Uses ``orjson`` when it is installed and falls back to the standard
+    library otherwise; both produce equivalent, non-ASCII-escaped output.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def load_path(path: Path) -> Any:
+    """Read and decode the UTF-8 JSON document at *path*.
+
+    The file is read as bytes in one call and decoded by ``orjson`` when it
+    is installed, falling back to the standard library otherwise.  Raises
+    ``OSError`` if the file cannot be read and ``json.JSONDecodeError`` if
+    it is not valid UTF-8 JSON, whichever decoder runs.
+    """
+    raw = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)  # orjson.JSONDecodeError subclasses json's
+    try:
+        text = raw.decode("utf-8")
+    except UnicodeDecodeError as e:
+        raise json.JSONDecodeError(str(e), "", 0) from e
+    return json.loads(text)
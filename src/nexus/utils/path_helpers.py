@@ -1,6 +1,15 @@
 import os
 import sys
 
+# Project root in development, resolved once at import:
+# path_helpers.py is in src/nexus/utils/
+# .. -> src/nexus/
+# .. -> src/
+# .. -> Nexus/ (Project Root)
+_DEV_BASE_PATH = os.path.abspath(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..")
+)
+
 
 def get_resource_path(relative_path_from_project_root):
     """Get absolute path to resource, works for dev and for PyInstaller bundled app.
@@ -12,13 +21,6 @@ def get_resource_path(relative_path_from_project_root):
         base_path = sys._MEIPASS
     else:
         # Running in development
-        # Go up from the current file's directory (e.g., src/nexus/utils/path_helpers.py)
-        # to the project root (Nexus/)
-        # path_helpers.py is in src/nexus/utils/
-        # .. -> src/nexus/
-        # .. -> src/
-        # .. -> Nexus/ (Project Root)
-        current_file_dir = os.path.dirname(os.path.abspath(__file__))
-        base_path = os.path.abspath(os.path.join(current_file_dir, "..", "..", ".."))
+        base_path = _DEV_BASE_PATH
 
     return os.path.join(base_path, relative_path_from_project_root)
@@ -1,120 +1,218 @@
 """URL Processing Utilities."""
 
 import re
-from urllib.parse import urlparse
+import string
+from collections.abc import Iterable, Mapping
+from functools import lru_cache
+from types import MappingProxyType
 
 from nexus.core.config import Config, logger, privacy_fingerprint
 
+try:
+    import ahocorasick  # optional: pyahocorasick, linear-time substring sweep
+except ImportError:
+    ahocorasick = None
+
+try:
+    import re2  # optional: google-re2, linear-time extraction scan
+except ImportError:
+    re2 = None
+
+
+# Literal patterns used per call are compiled once at import.
+_RE_MULTI_SPACE = re.compile(r" {2,}")
+
+# Snapshot of the config read by the cached validators below.
+_SUPPORTED_PROTOCOLS = frozenset(Config.SUPPORTED_PROTOCOLS)
+# Scheme prefixes whose host follows "://"; any other "scheme://" is rejected.
+_HOST_SCHEME_PREFIXES = tuple(
+    f"{scheme}://"
+    for scheme in ("https", "http", "ftp", "ftps")  # most common first
+    if scheme in _SUPPORTED_PROTOCOLS
+)
+_RE_CONCAT_BOUNDARY = re.compile(r"https?://|www\.")
+_RE_SCHEME = re.compile(r"^[a-zA-Z]+://")
+# Lowercase web schemes, most common first; one C-level startswith answers
+# the usual case before the scheme regex has to run.
+_WEB_SCHEME_PREFIXES = ("https://", "http://")
+_RE_DOMAIN_LIKE = re.compile(r"^[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
+
+# Punctuation that commonly trails a URL in prose ("see example.com.").
+_TRAILING_PUNCTUATION = ".,;:!?)"
+# Extraction candidates never start with whitespace or punctuation (every
+# pattern anchors on a scheme, "www." or an alphanumeric), so trimming them
+# only needs one right-hand pass over both sets.
+_CANDIDATE_TRIM_CHARS = string.whitespace + _TRAILING_PUNCTUATION
+
+# Deletes every character allowed in a URL; anything left over is invalid.
+_URL_ALLOWED_CHARS = string.ascii_letters + string.digits + "-._~:/?#[]@!$&'()*+,;=%"
+_STRIP_URL_CHARS = str.maketrans("", "", _URL_ALLOWED_CHARS)
+
+# Byte tables for sanitizing: line breaks and tabs become spaces, the other
+# ASCII control characters (and DEL) are dropped.  Non-ASCII never reaches
+# these tables; the ASCII encode removes it first.
+_SANITIZE_SPACES = bytes.maketrans(b"\t\r\n", b"   ")
+_SANITIZE_DROP = bytes(c for c in range(0x20) if c not in b"\t\r\n") + b"\x7f"
+
+
+# URL patterns are compiled once per process at import; every
+# ``URLProcessor`` shares them.
+#
+# All patterns are evaluated against text bounded by
+# ``Config.MAX_URL_EXTRACTION_LENGTH`` (default 10 000 chars), so the
+# catastrophic-backtracking risk in the domain pattern is contained.  The
+# length cap is enforced in :meth:`URLProcessor.extract_urls` before any
+# regex runs.
+_URL_PATTERNS: Mapping[str, re.Pattern[str]] = MappingProxyType(
+    {
+        # Standard URLs with protocols
+        "protocol": re.compile(
+            r'(?:https?|ftp|ftps)://[^\s<>"{}|\\^`\[\]]+', re.IGNORECASE
+        ),
+        # www URLs without protocol
+        "www": re.compile(r'www\.[^\s<>"{}|\\^`\[\]]+', re.IGNORECASE),
+        # Domain-based URLs without protocol
+        "domain": re.compile(
+            r'[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?(?:\.[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?)*\.[a-zA-Z]{2,}(?:/[^\s<>"{}|\\^`\[\]]*)?',
+            re.IGNORECASE,
+        ),
+        # Shortened URLs (bit.ly, tinyurl, etc.)
+        "shortened": re.compile(
+            r"(?:bit\.ly|tinyurl\.com|t\.co|goo\.gl|short\.link|is\.gd|v\.gd|ow\.ly|buff\.ly|rebrand\.ly)/[a-zA-Z0-9]+",
+            re.IGNORECASE,
+        ),
+        # Concatenated URLs without spaces
+        "concatenated": re.compile(
+            r'(?:https?://[^\s<>"{}|\\^`\[\]]+){2,}', re.IGNORECASE
+        ),
+    }
+)
+
+# Single-URL patterns, in the order they are tried at each position.
+_SINGLE_URL_PATTERN_NAMES = ("protocol", "www", "domain", "shortened")
+
+# All single-URL patterns fused into one alternation so extraction scans the
+# text once.  ``shortened`` comes after ``domain`` because the domain pattern
+# also matches shortener links *with* any trailing path, which is the longer
+# (preferred) candidate.  Extraction only scans sanitized, ASCII-only text,
+# so ``re.ASCII`` changes no match and spares IGNORECASE Unicode folding.
+_COMBINED_PATTERN = re.compile(
+    "|".join(
+        f"(?P<{name}>{_URL_PATTERNS[name].pattern})"
+        for name in _SINGLE_URL_PATTERN_NAMES
+    ),
+    re.IGNORECASE | re.ASCII,
+)
+
+
+def _compile_re2_scanner():
+    """Compile the combined pattern with RE2, if it is installed.
+
+    RE2 runs the alternation as an automaton, in time linear in the text,
+    with the same leftmost-first preference as ``re``.  Its ``\\s`` is
+    ASCII-only, which is equivalent on sanitized text.
+    """
+    if re2 is None:
+        return None
+    try:
+        return re2.compile("(?i)" + _COMBINED_PATTERN.pattern)
+    except re2.error as e:
+        logger.warning("RE2 URL scanner unavailable: %s", e)
+        return None
+
+
+# Pattern used for the single extraction scan: RE2 when available.
+_EXTRACTION_SCANNER = _compile_re2_scanner() or _COMBINED_PATTERN
+
+# Combined pattern for fallback
+_FALLBACK_PATTERN = re.compile(
+    r'https?://[^\s<>"{}|\\^`\[\]]+'
+    r'|www\.[^\s<>"{}|\\^`\[\]]+'
+    r'|[a-zA-Z0-9-]+\.[a-zA-Z]{2,}(?:/[^\s<>"{}|\\^`\[\]]*)?',
+    re.IGNORECASE | re.ASCII,
+)
+
+_BLACKLIST_EXTENSIONS = frozenset(
+    {
+        "txt",
+        "md",
+        "png",
+        "jpg",
+        "jpeg",
+        "gif",
+        "svg",
+        "pdf",
+        "doc",
+        "docx",
+        "xls",
+        "xlsx",
+        "ppt",
+        "pptx",
+        "zip",
+        "rar",
+        "7z",
+        "py",
+        "js",
+        "css",
+        "html",
+        "mp3",
+        "mp4",
+        "avi",
+        "mov",
+        "mkv",
+        "exe",
+        "dmg",
+        "pkg",
+        "deb",
+        "rpm",
+    }
+)
+
+# Common URL shortening services
+_SHORTENING_SERVICES = frozenset(
+    {
+        "bit.ly",
+        "tinyurl.com",
+        "t.co",
+        "goo.gl",
+        "short.link",
+        "is.gd",
+        "v.gd",
+        "ow.ly",
+        "buff.ly",
+        "rebrand.ly",
+        "tiny.cc",
+        "shorturl.at",
+    }
+)
+
 
 class URLProcessor:
     """Handles all logic for extracting, cleaning, and validating URLs with enhanced accuracy."""
 
     def __init__(self):
-        # Enhanced regex patterns for different URL formats.
-        #
-        # All patterns are evaluated against text bounded by
-        # ``Config.MAX_URL_EXTRACTION_LENGTH`` (default 10 000 chars), so
-        # the catastrophic-backtracking risk in the domain pattern is
-        # contained.  The length cap is enforced in :meth:`extract_urls`
-        # before any regex runs.
-        self.url_patterns = {
-            # Standard URLs with protocols
-            "protocol": re.compile(
-                r'(?:https?|ftp|ftps)://[^\s<>"{}|\\^`\[\]]+', re.IGNORECASE
-            ),
-            # www URLs without protocol
-            "www": re.compile(r'www\.[^\s<>"{}|\\^`\[\]]+', re.IGNORECASE),
-            # Domain-based URLs without protocol
-            "domain": re.compile(
-                r'[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?(?:\.[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?)*\.[a-zA-Z]{2,}(?:/[^\s<>"{}|\\^`\[\]]*)?',
-                re.IGNORECASE,
-            ),
-            # Shortened URLs (bit.ly, tinyurl, etc.)
-            "shortened": re.compile(
-                r"(?:bit\.ly|tinyurl\.com|t\.co|goo\.gl|short\.link|is\.gd|v\.gd|ow\.ly|buff\.ly|rebrand\.ly)/[a-zA-Z0-9]+",
-                re.IGNORECASE,
-            ),
-            # Concatenated URLs without spaces
-            "concatenated": re.compile(
-                r'(?:https?://[^\s<>"{}|\\^`\[\]]+){2,}', re.IGNORECASE
-            ),
-        }
-
-        # Combined pattern for fallback
-        self.fallback_pattern = re.compile(
-            r'https?://[^\s<>"{}|\\^`\[\]]+'
-            r'|www\.[^\s<>"{}|\\^`\[\]]+'
-            r'|[a-zA-Z0-9-]+\.[a-zA-Z]{2,}(?:/[^\s<>"{}|\\^`\[\]]*)?',
-            re.IGNORECASE,
-        )
-
-        self.blacklist_extensions = {
-            "txt",
-            "md",
-            "png",
-            "jpg",
-            "jpeg",
-            "gif",
-            "svg",
-            "pdf",
-            "doc",
-            "docx",
-            "xls",
-            "xlsx",
-            "ppt",
-            "pptx",
-            "zip",
-            "rar",
-            "7z",
-            "py",
-            "js",
-            "css",
-            "html",
-            "mp3",
-            "mp4",
-            "avi",
-            "mov",
-            "mkv",
-            "exe",
-            "dmg",
-            "pkg",
-            "deb",
-            "rpm",
-        }
-
-        # Common URL shortening services
-        self.shortening_services = {
-            "bit.ly",
-            "tinyurl.com",
-            "t.co",
-            "goo.gl",
-            "short.link",
-            "is.gd",
-            "v.gd",
-            "ow.ly",
-            "buff.ly",
-            "rebrand.ly",
-            "tiny.cc",
-            "shorturl.at",
-        }
+        self.url_patterns = _URL_PATTERNS
+        self.combined_pattern = _COMBINED_PATTERN
+        self.fallback_pattern = _FALLBACK_PATTERN
+        self.blacklist_extensions = _BLACKLIST_EXTENSIONS
+        self.shortening_services = _SHORTENING_SERVICES
 
     def sanitize_text_for_extraction(self, text: str) -> str:
         """Enhanced text preprocessing that preserves URL-relevant characters."""
         if not isinstance(text, str):
             return ""
 
-        # Remove zero-width characters and normalize whitespace
-        text = re.sub(r"[\u200B-\u200D\u202F\u205F\u3000\xA0]", "", text)
-
-        # Handle line breaks within URLs by replacing with spaces
-        text = re.sub(r"[\r\n]+", " ", text)
-
-        # Normalize multiple spaces to single space, but preserve URL structure
-        text = re.sub(r"[ \t]+", " ", text)
-
-        # Remove non-printable characters but preserve URL-relevant punctuation
-        text = re.sub(r"[^\x20-\x7E]", "", text)
-
+        # Work on ASCII bytes: the encode drops everything outside ASCII
+        # (zero-width spaces, NBSP, ...) and is a plain copy for the common
+        # all-ASCII paste; bytes.translate then maps line breaks and tabs to
+        # spaces and deletes the remaining control characters in one C loop.
+        data = text.encode("ascii", "ignore")
+        text = data.translate(_SANITIZE_SPACES, _SANITIZE_DROP).decode("ascii")
+
+        # Collapse the remaining runs of spaces in one pass; the substring
+        # probe lets the usual single-spaced paste skip the regex entirely.
+        if "  " in text:
+            text = _RE_MULTI_SPACE.sub(" ", text)
         return text.strip()
 
     def extract_urls(self, text: str) -> list[str]:
@@ -131,6 +229,11 @@ class URLProcessor:
             )
             text = text[: Config.MAX_URL_EXTRACTION_LENGTH]
 
+        # Every valid URL contains a dot; most pasted prose without one can
+        # skip sanitizing and the regex scans entirely.
+        if "." not in text:
+            return []
+
         try:
             # Use enhanced extraction if enabled
             if Config.ENABLE_ENHANCED_URL_EXTRACTION:
@@ -148,8 +251,12 @@ class URLProcessor:
         cleaned_text = self.sanitize_text_for_extraction(text)
         all_urls = set()
 
-        # First, handle concatenated URLs and remove them from the text to avoid double matching
-        concatenated_urls = self._split_concatenated_urls(cleaned_text)
+        # First, handle concatenated URLs and remove them from the text to avoid double matching.
+        # The splitter only cuts at "http(s)://" and "www.", so skip it when neither occurs.
+        if "://" in cleaned_text or "www." in cleaned_text:
+            concatenated_urls = self._split_concatenated_urls(cleaned_text)
+        else:
+            concatenated_urls = []
         all_urls.update(concatenated_urls)
 
         # Remove concatenated URL patterns from text to avoid double matching
@@ -157,22 +264,13 @@ class URLProcessor:
         for url in concatenated_urls:
             text_without_concatenated = text_without_concatenated.replace(url, " ")
 
-        # Extract URLs using each pattern (excluding concatenated pattern)
-        # Process shortened URLs first to take precedence over domain matches
-        pattern_order = ["shortened", "protocol", "www", "domain"]
-
-        for pattern_name in pattern_order:
-            if pattern_name in self.url_patterns:
-                pattern = self.url_patterns[pattern_name]
-                try:
-                    matches = pattern.findall(text_without_concatenated)
-                    if matches:
-                        logger.debug(
-                            "Pattern '%s' found %d URLs", pattern_name, len(matches)
-                        )
-                        all_urls.update(matches)
-                except (ValueError, TypeError, re.error) as e:
-                    logger.warning("Pattern '%s' failed: %s", pattern_name, e)
+        # Extract the remaining URLs in a single pass over the text
+        match_count = 0
+        for match in _EXTRACTION_SCANNER.finditer(text_without_concatenated):
+            all_urls.add(match.group(0))
+            match_count += 1
+        if match_count:
+            logger.debug("Combined pattern found %d URLs", match_count)
 
         # Remove URLs that are substrings of shortened URLs
         filtered_urls = self._remove_shortened_url_substrings(list(all_urls))
@@ -182,32 +280,82 @@ class URLProcessor:
 
     def _remove_shortened_url_substrings(self, urls: list[str]) -> list[str]:
         """Remove URLs that are substrings of other URLs to avoid duplicates."""
-        # Sort URLs by length (longest first) so the longest candidate is
-        # always the one we keep when two are substrings of each other.
-        sorted_urls: list[str] = sorted(urls, key=lambda item: len(item), reverse=True)
+        # Order URLs longest first so the longest candidate is always the one
+        # we keep when two are substrings of each other.  Bucketing by length
+        # only sorts the handful of distinct lengths, not every URL, and keeps
+        # input order within a length exactly as a stable sort would.
+        by_length: dict[int, list[str]] = {}
+        for url in urls:
+            by_length.setdefault(len(url), []).append(url)
+        sorted_urls: list[str] = [
+            url
+            for length in sorted(by_length, reverse=True)
+            for url in by_length[length]
+        ]
+        if ahocorasick is not None and len(sorted_urls) > 1:
+            return self._remove_url_substrings_with_automaton(sorted_urls)
         filtered_urls: list[str] = []
-
-        # Boundary characters that prove a match ends at a real URL
-        # delimiter rather than mid-word.  ``startswith`` covers the case
-        # where the long URL begins with the short one (e.g. the bare host
-        # of a longer URL).
-        boundary_chars = ("/", "?", "#")
+        # Only kept URLs that are themselves valid can absorb shorter ones;
+        # their validity is checked once here instead of once per pair.
+        containers: list[str] = []
 
         for url in sorted_urls:
+            url_len = len(url)
             is_substring = False
-            for existing_url in filtered_urls:
-                if url == existing_url or url not in existing_url:
-                    continue
-                if not self._is_valid_url(existing_url):
-                    continue
-                if any(
-                    url + boundary in existing_url for boundary in boundary_chars
-                ) or existing_url.startswith(url):
-                    is_substring = True
+            for existing_url in containers:
+                # A hit counts if it starts the longer URL or is followed by a
+                # path/query/fragment delimiter; scan every occurrence in place
+                # rather than building "url + delimiter" strings.
+                index = existing_url.find(url)
+                while index != -1:
+                    end = index + url_len
+                    if index == 0 or (
+                        end < len(existing_url) and existing_url[end] in "/?#"
+                    ):
+                        is_substring = url != existing_url
+                        break
+                    index = existing_url.find(url, index + 1)
+                if is_substring:
                     break
 
             if not is_substring:
                 filtered_urls.append(url)
+                if self._is_valid_url(url):
+                    containers.append(url)
+
+        return filtered_urls
+
+    def _remove_url_substrings_with_automaton(
+        self, sorted_urls: list[str]
+    ) -> list[str]:
+        """Aho-Corasick version of :meth:`_remove_shortened_url_substrings`.
+
+        ``sorted_urls`` must be longest first.  Each kept URL is swept once
+        for every candidate it contains, instead of testing every pair.
+        """
+        automaton = ahocorasick.Automaton()
+        for url in sorted_urls:
+            automaton.add_word(url, url)
+        automaton.make_automaton()
+
+        contained: set[str] = set()
+        filtered_urls: list[str] = []
+        for existing_url in sorted_urls:
+            if existing_url in contained:
+                continue
+            filtered_urls.append(existing_url)
+            if not self._is_valid_url(existing_url):
+                continue
+            last = len(existing_url) - 1
+            for end, url in automaton.iter(existing_url):
+                if url == existing_url or url in contained:
+                    continue
+                # Same rule as the pure-Python path: the match must start the
+                # URL or be followed by a path/query/fragment delimiter.
+                if end - len(url) == -1 or (
+                    end < last and existing_url[end + 1] in "/?#"
+                ):
+                    contained.add(url)
 
         return filtered_urls
 
@@ -219,48 +367,24 @@ class URLProcessor:
 
     def _split_concatenated_urls(self, text: str) -> list[str]:
         """Detect and split URLs that are concatenated without spaces."""
-        concatenated_urls = []
+        # One scan finds every "http(s)://" and "www." boundary.  Each kind is
+        # then sliced up to its own next boundary, so that for example
+        # "https://site1.comhttps://site2.com" and
+        # "www.site1.comwww.site2.com" split into separate URLs.
+        protocol_starts: list[int] = []
+        www_starts: list[int] = []
+        for match in _RE_CONCAT_BOUNDARY.finditer(text):
+            if match.group() == "www.":
+                www_starts.append(match.start())
+            else:
+                protocol_starts.append(match.start())
 
-        # Look for patterns like "https://site1.comhttps://site2.com"
-        # Split on protocol boundaries
-        protocol_split = re.split(r"(https?://)", text)
-        for i in range(1, len(protocol_split), 2):  # Skip the first empty part
-            if i + 1 < len(protocol_split):
-                protocol = protocol_split[i]  # "https://" or "http://"
-                domain_part = protocol_split[i + 1]  # The domain and path part
-
-                # Find where the next URL starts (if any)
-                next_protocol_match = re.search(r"https?://", domain_part)
-                if next_protocol_match:
-                    # Split at the next protocol
-                    current_url = protocol + domain_part[: next_protocol_match.start()]
-                    if self._is_valid_url(current_url):
-                        concatenated_urls.append(current_url)
-                else:
-                    # This is the last URL
-                    current_url = protocol + domain_part
-                    if self._is_valid_url(current_url):
-                        concatenated_urls.append(current_url)
-
-        # Look for patterns like "www.site1.comwww.site2.com"
-        www_split = re.split(r"(www\.)", text)
-        for i in range(1, len(www_split), 2):  # Skip the first empty part
-            if i + 1 < len(www_split):
-                www_prefix = www_split[i]  # "www."
-                domain_part = www_split[i + 1]  # The domain and path part
-
-                # Find where the next www starts (if any)
-                next_www_match = re.search(r"www\.", domain_part)
-                if next_www_match:
-                    # Split at the next www
-                    current_url = www_prefix + domain_part[: next_www_match.start()]
-                    if self._is_valid_url(current_url):
-                        concatenated_urls.append(current_url)
-                else:
-                    # This is the last URL
-                    current_url = www_prefix + domain_part
-                    if self._is_valid_url(current_url):
-                        concatenated_urls.append(current_url)
+        concatenated_urls = []
+        for starts in (protocol_starts, www_starts):
+            for start, end in zip(starts, [*starts[1:], len(text)]):
+                current_url = text[start:end]
+                if self._is_valid_url(current_url):
+                    concatenated_urls.append(current_url)
 
         return concatenated_urls
 
@@ -269,9 +393,10 @@ class URLProcessor:
         valid_urls = set()
         invalid_count = 0
 
-        for url in urls:
-            # Clean and trim the URL
-            url = url.strip().rstrip(".,;:!?)")
+        # Clean and trim the URLs; candidates that only differed in trailing
+        # punctuation ("a.com" / "a.com.") are checked once.
+        trimmed = dict.fromkeys(url.rstrip(_CANDIDATE_TRIM_CHARS) for url in urls)
+        for url in trimmed:
             if not url:
                 continue
 
@@ -302,27 +427,27 @@ class URLProcessor:
 
     def _should_filter_by_extension(self, url: str) -> bool:
         """Check if URL should be filtered based on file extension."""
-        try:
-            # Extract the path part after any query parameters
-            path_part = url.split("?")[0].split("#")[0]
-            extension = path_part.split(".")[-1].lower()
-
-            # Only filter if it's clearly a file extension and not a domain
-            if extension in self.blacklist_extensions:
-                # Don't filter if it has a protocol or www prefix
-                if re.match(r"^(https?://|www\.)", url):
-                    return False
-                # Don't filter if it has a path (likely a real URL)
-                if "/" in url:
-                    return False
-                # Filter if it looks like a file
-                return True
-        except (IndexError, AttributeError):
-            pass
+        # Extract the path part before any query or fragment; partition and
+        # rpartition return tuples instead of building split() lists.
+        path_part = url.partition("?")[0].partition("#")[0]
+        extension = path_part.rpartition(".")[2].lower()
+
+        # Only filter if it's clearly a file extension and not a domain
+        if extension in self.blacklist_extensions:
+            # Don't filter if it has a protocol or www prefix
+            if url.startswith(("http://", "https://", "www.")):
+                return False
+            # Don't filter if it has a path (likely a real URL)
+            if "/" in url:
+                return False
+            # Filter if it looks like a file
+            return True
         return False
 
-    def _is_valid_url(self, url: str) -> bool:
-        """Enhanced URL validation with comprehensive checks."""
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _is_valid_url(url: str) -> bool:
+        """Enhanced URL validation with comprehensive checks (memoized per URL)."""
         if not url or len(url) <= 3:
             return False
 
@@ -335,42 +460,59 @@ class URLProcessor:
             return False
 
         # Check for valid characters
-        if not re.match(r"^[a-zA-Z0-9\-._~:/?#[\]@!$&'()*+,;=%]+$", url):
+        if not url.isascii() or url.translate(_STRIP_URL_CHARS):
             return False
 
-        # Check for protocol validation
-        if re.match(r"^[a-zA-Z]+://", url):
-            protocol = url.split("://")[0].lower()
-            if protocol not in Config.SUPPORTED_PROTOCOLS:
-                return False
-
-        # Check for valid domain structure
-        try:
-            parsed = urlparse(
-                url
-                if url.startswith(("http://", "https://", "ftp://", "ftps://"))
-                else "https://" + url
-            )
-            if not parsed.netloc:
+        # Dispatch on shape.  A supported lowercase scheme needs no further
+        # scheme check.  Any other "scheme://" (unsupported, or upper-case
+        # such as "HTTP://") would leave "SCHEME:" as the host, which has no
+        # dot, so it is rejected outright.  www and bare domains have no
+        # scheme and go straight to the host check.
+        if url.startswith(_HOST_SCHEME_PREFIXES):
+            return URLProcessor._has_valid_host(url.partition("://")[2])
+        if _RE_SCHEME.match(url):
+            return False
+        return URLProcessor._has_valid_host(url)
+
+    @staticmethod
+    def _has_valid_host(rest: str) -> bool:
+        """Check the host at the start of *rest* (a URL without its scheme)."""
+        # Only the host is needed, so slice it out with partition instead of
+        # building a full urlparse result.
+        netloc = rest.partition("/")[0].partition("?")[0].partition("#")[0]
+        if "[" in netloc or "]" in netloc:
+            # Bracketed (IPv6) hosts keep urlparse's stricter checking
+            from urllib.parse import urlparse
+
+            try:
+                netloc = urlparse("https://" + rest).netloc
+            except ValueError:
                 return False
+        if not netloc:
+            return False
 
-            # Check domain parts
-            domain_parts = parsed.netloc.split(".")
-            if len(domain_parts) < 2:
-                return False
+        # Check domain parts
+        domain_parts = netloc.split(".")
+        if len(domain_parts) < 2:
+            return False
 
-            # Check TLD
-            tld = domain_parts[-1]
-            if len(tld) < 2 or not tld.isalpha():
-                return False
+        # Check TLD
+        tld = domain_parts[-1]
+        return len(tld) >= 2 and tld.isalpha()
 
-        except (ValueError, IndexError, AttributeError):
-            return False
+    def normalize_urls(self, urls: Iterable[str]) -> list[str | None]:
+        """Normalize many URLs at once; ``None`` marks entries that fail.
 
-        return True
+        Results line up with *urls*.  The memoized :meth:`_normalize_url` is
+        mapped directly, so repeated URLs in a pasted batch are answered
+        from the cache without a Python-level call per item.
+        """
+        return list(map(URLProcessor._normalize_url, urls))
 
-    def _normalize_url(self, url: str) -> str | None:
-        """Enhanced URL normalization with better error handling."""
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def _normalize_url(url: str) -> str | None:
+        """Enhanced URL normalization with better error handling (memoized per URL)."""
         if not url:
             return None
 
@@ -378,22 +520,24 @@ class URLProcessor:
         url = url.strip()
 
         # Remove trailing punctuation
-        url = url.rstrip(".,;:!?)")
+        url = url.rstrip(_TRAILING_PUNCTUATION)
 
         # Add protocol if missing
-        if not re.match(r"^[a-zA-Z]+://", url):
+        if not url.startswith(_WEB_SCHEME_PREFIXES) and not _RE_SCHEME.match(url):
             # Check if it's a www URL
             if url.startswith("www."):
                 url = "https://" + url
             # Check if it looks like a domain
-            elif re.match(r"^[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}", url):
+            elif _RE_DOMAIN_LIKE.match(url):
                 url = "https://" + url
             else:
                 return None
 
-        if not self._is_valid_url(url):
+        if not URLProcessor._is_valid_url(url):
             return None
 
+        from urllib.parse import urlparse
+
         try:
             parsed = urlparse(url)
             if parsed.scheme and parsed.netloc:
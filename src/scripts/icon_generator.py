@@ -8,8 +8,7 @@ import os
 import shutil
 import subprocess
 import sys
-
-from PIL import Image
+from concurrent.futures import ThreadPoolExecutor
 
 
 def extract_png_from_icns(icns_path, output_path, size=1024):
@@ -55,6 +54,18 @@ def extract_png_from_icns(icns_path, output_path, size=1024):
         return False
 
 
+def _save_icon_level(image, paths):
+    """Encode one icon level to PNG once, then copy it to any sibling filenames.
+
+    Args:
+        image (PIL.Image.Image): The resized level; not modified here
+        paths (list[str]): Destination files that share this pixel size
+    """
+    image.save(paths[0], "PNG")
+    for path in paths[1:]:
+        shutil.copyfile(paths[0], path)
+
+
 def create_icns_from_png(png_path, output_icns):
     """Create a proper .icns file from PNG using iconutil (macOS built-in tool).
 
@@ -69,6 +80,9 @@ def create_icns_from_png(png_path, output_icns):
     Returns:
         bool: True if creation successful, False otherwise
     """
+    # Imported here so usage errors and the sips step never pay for loading PIL
+    from PIL import Image
+
     try:
         # Create a .iconset directory - this is what iconutil expects
         iconset_dir = png_path.replace(".png", ".iconset")
@@ -95,11 +109,30 @@ def create_icns_from_png(png_path, output_icns):
                 # Convert to RGBA to preserve transparency
                 img = img.convert("RGBA")
 
-            # Create each required size
+            # Group filenames by pixel size (several share one size) and walk
+            # the sizes largest-first, each resized from the previous level.
+            # Halving steps keep LANCZOS quality while the source shrinks.
+            filenames_by_size = {}
             for size, filename in sizes:
-                # Use LANCZOS resampling for high-quality resizing
-                resized = img.resize((size, size), Image.Resampling.LANCZOS)
-                resized.save(os.path.join(iconset_dir, filename), "PNG")
+                filenames_by_size.setdefault(size, []).append(filename)
+
+            # PNG encoding releases the GIL, so each finished level is saved on
+            # a worker thread while the main thread resizes the next one.
+            img.load()
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                saves = []
+                current = img
+                for size in sorted(filenames_by_size, reverse=True):
+                    if current.size != (size, size):
+                        # Use LANCZOS resampling for high-quality resizing
+                        current = current.resize((size, size), Image.Resampling.LANCZOS)
+                    paths = [
+                        os.path.join(iconset_dir, filename)
+                        for filename in filenames_by_size[size]
+                    ]
+                    saves.append(executor.submit(_save_icon_level, current, paths))
+                for save in saves:
+                    save.result()  # re-raise any save error
 
         print(f"   ✅ Created all {len(sizes)} icon sizes in iconset")
 
@@ -107,4 +107,6 @@ def test_build_open_in_front_window_script_escapes_user_urls():
     )
 
     assert 'set URL of front document to "https://example.com/path?\\"x\\"=1\\\\2\\nnext\\rline"' in script
-    assert 'make new tab with properties {URL:"https://b.com"}' in script
+    assert 'repeat with u in {"https://b.com"}' in script
+    assert "make new tab with properties {URL:(contents of u)}" in script
+    assert "delay" not in script
@@ -21,6 +21,17 @@ def test_group_urls_by_domain_lowercases_domains() -> None:
     }
 
 
+def test_group_urls_by_domain_buckets_unparseable_urls() -> None:
+    grouped = SafariController._group_urls_by_domain(
+        ["https://[::1/broken", "https://example.com/a"]
+    )
+
+    assert grouped == {
+        "unknown": ["https://[::1/broken"],
+        "example.com": ["https://example.com/a"],
+    }
+
+
 def test_open_urls_returns_false_for_empty_input() -> None:
     assert asyncio.run(SafariController.open_urls([])) is False
 
@@ -113,6 +124,46 @@ def test_open_urls_uses_stealth_grouping_when_enabled(monkeypatch) -> None:
     ]
 
 
+def test_open_urls_with_stealth_opens_domains_one_at_a_time(monkeypatch) -> None:
+    events: list[str] = []
+
+    async def fake_run_batch(
+        urls: list[str],
+        *,
+        create_window: bool = False,
+        private_mode: bool = True,
+    ) -> bool:
+        events.append(f"open {urls[0]} window={create_window}")
+        return urls != ["https://b.test"]
+
+    async def fake_sleep(_delay: float) -> None:
+        events.append("sleep")
+
+    monkeypatch.setattr(SafariController, "_run_batch", fake_run_batch)
+    monkeypatch.setattr(safari.asyncio, "sleep", fake_sleep)
+
+    result = asyncio.run(
+        SafariController._open_urls_with_stealth(
+            {
+                "a.test": ["https://a.test"],
+                "b.test": ["https://b.test"],
+                "c.test": ["https://c.test"],
+            }
+        )
+    )
+
+    assert result is False
+    # Each domain waits out its delay before the next one starts, in order.
+    assert events == [
+        "open https://a.test window=True",
+        "sleep",
+        "open https://b.test window=False",
+        "sleep",
+        "open https://c.test window=False",
+        "sleep",
+    ]
+
+
 def test_open_urls_in_front_window_returns_false_on_applescript_error(
     monkeypatch,
 ) -> None:
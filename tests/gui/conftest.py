@@ -0,0 +1,30 @@
+"""Shared fixtures for the GUI tests."""
+
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+@pytest.fixture(scope="session")
+def app():
+    """One QApplication for the whole session; Qt allows only one anyway."""
+    from PySide6.QtWidgets import QApplication
+
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def window(tmp_path, monkeypatch, app):
+    """Build a MainWindow whose bookmark/group files live in tmp_path."""
+    from PySide6.QtCore import QStandardPaths
+
+    from nexus.gui.main_window import MainWindow
+
+    monkeypatch.setattr(QStandardPaths, "writableLocation", lambda *_: str(tmp_path))
+    w = MainWindow()
+    try:
+        yield w
+    finally:
+        w.close()
@@ -0,0 +1,128 @@
+"""Sidebar bookmark filter index."""
+
+import os
+from types import SimpleNamespace
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+pytest.importorskip("PySide6")
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QTreeWidget, QTreeWidgetItem
+
+from nexus.gui import main_window
+from nexus.gui.main_window import MainWindow, _BookmarkSearchIndex
+
+
+def _tree() -> QTreeWidget:
+    tree = QTreeWidget()
+    for folder_name, bookmarks in (
+        ("Work", [("Docs", "https://docs.example.com")]),
+        ("Fun", [("Video", "https://video.example.org"), ("Games", "")]),
+        ("Café", [("Crème brûlée", "https://dessert.example.fr/crème")]),
+    ):
+        folder = QTreeWidgetItem([folder_name])
+        for name, url in bookmarks:
+            child = QTreeWidgetItem([name])
+            child.setData(0, Qt.ItemDataRole.UserRole, {"name": name, "url": url})
+            folder.addChild(child)
+        tree.addTopLevelItem(folder)
+    return tree
+
+
+def test_search_index_shows_matching_bookmarks_and_their_folders(app):
+    tree = _tree()
+    index = _BookmarkSearchIndex(tree)
+    names = [item.text(0) for item in index.items]
+    assert names == ["Work", "Docs", "Fun", "Video", "Games", "Café", "Crème brûlée"]
+
+    # URL hit keeps its folder visible; the sibling stays hidden.
+    shown = index.visibility("video.example")
+    assert [n for n, s in zip(names, shown) if s] == ["Fun", "Video"]
+
+    # A folder hit shows every bookmark inside it.
+    shown = index.visibility("work")
+    assert [n for n, s in zip(names, shown) if s] == ["Work", "Docs"]
+
+    # Matches never straddle the boundary between two fields.
+    assert not any(index.visibility("docs" + "https"))
+    assert all(index.visibility(""))
+
+
+def test_search_index_matches_any_query_token(app):
+    tree = _tree()
+    index = _BookmarkSearchIndex(tree)
+    names = [item.text(0) for item in index.items]
+
+    shown = index.visibility("docs  video")
+    assert [n for n, s in zip(names, shown) if s] == ["Work", "Docs", "Fun", "Video"]
+    assert index.matching_rows("games nope") == [4]
+
+
+@pytest.mark.skipif(
+    main_window.ahocorasick is None, reason="pyahocorasick not installed"
+)
+def test_search_index_automaton_agrees_with_find_sweep(app, monkeypatch):
+    tree = _tree()
+    index = _BookmarkSearchIndex(tree)
+    queries = ["example video", "o e", "work games", "https docs", "zz qq"]
+    with_automaton = [index.matches(q) for q in queries]
+    monkeypatch.setattr(main_window, "ahocorasick", None)
+    assert [index.matches(q) for q in queries] == with_automaton
+
+
+def test_search_index_narrowing_query_rechecks_previous_hits(app):
+    tree = _tree()
+    index = _BookmarkSearchIndex(tree)
+
+    for query in ("e", "ex", "exa", "example.o", "o", "video", "vid", "d", "do"):
+        assert index.matches(query) == _BookmarkSearchIndex(tree).matches(query)
+    assert index.matching_rows("  ") == []
+    assert index.shown_rows("fun") == {2, 3, 4}
+
+
+def test_search_index_prefers_precomputed_search_text(app):
+    tree = _tree()
+    docs = tree.topLevelItem(0).child(0)
+    docs.setData(0, main_window._SEARCH_TEXT_ROLE, "handbook\0https://docs.example.com")
+    index = _BookmarkSearchIndex(tree)
+
+    assert index.matching_rows("handbook") == [1]
+    assert (
+        main_window._bookmark_search_text(
+            {"name": "Docs", "url": "HTTPS://Docs.example.com"}
+        )
+        == "docs\0https://docs.example.com"
+    )
+
+
+def test_search_index_matches_non_ascii_text(app):
+    tree = _tree()
+    index = _BookmarkSearchIndex(tree)
+
+    assert index.matching_rows("CAFÉ".lower()) == [5]
+    assert index.matching_rows("brûlée") == [6]
+    assert index.matching_rows("crème") == [6]
+    assert index.matching_rows("é docs") == [1, 5, 6]
+
+
+def test_filter_bookmarks_clears_and_skips_repeated_queries(app):
+    tree = QTreeWidget()
+    for name in ("Work", "Fun"):
+        tree.addTopLevelItem(QTreeWidgetItem([name]))
+    window = SimpleNamespace(bookmark_tree=tree, _bookmark_search_index=None)
+
+    MainWindow._filter_bookmarks(window, "work")
+    index = window._bookmark_search_index
+    assert index.hidden_rows == {1}
+
+    # The same query again (here padded) must not touch the tree.
+    index.hidden_rows = set()
+    MainWindow._filter_bookmarks(window, " Work ")
+    assert index.hidden_rows == set()
+
+    index.hidden_rows = {1}
+    MainWindow._filter_bookmarks(window, "")
+    assert index.hidden_rows == set()
+    assert not tree.topLevelItem(1).isHidden()
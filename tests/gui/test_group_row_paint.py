@@ -10,17 +10,11 @@ pytest.importorskip("PySide6")
 
 from PySide6.QtCore import QAbstractListModel, QSize
 from PySide6.QtGui import QColor
-from PySide6.QtWidgets import QApplication, QStyleOptionViewItem
+from PySide6.QtWidgets import QStyleOptionViewItem
 
 from nexus.gui.widgets.group_row_delegate import GroupRowDelegate
 
 
-@pytest.fixture
-def app():
-    a = QApplication.instance() or QApplication([])
-    yield a
-
-
 def _empty_model():
     class _Model(QAbstractListModel):
         def rowCount(self, parent=None):
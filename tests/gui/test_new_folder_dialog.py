@@ -8,20 +8,12 @@ import pytest
 os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
 pytest.importorskip("PySide6")
 
-from PySide6.QtWidgets import QApplication
-
 from nexus.gui.dialogs.new_folder_dialog import (
     DEFAULT_PALETTE,
     NewFolderDialog,
 )
 
 
-@pytest.fixture
-def app():
-    a = QApplication.instance() or QApplication([])
-    yield a
-
-
 def test_dialog_starts_with_first_palette_swatch_selected(app):
     dlg = NewFolderDialog()
     assert dlg.folder_name == ""
@@ -8,7 +8,7 @@ from PySide6.QtGui import QKeyEvent
 from PySide6.QtWidgets import QApplication
 
 from nexus.gui.main_window import MainWindow
-from nexus.gui.widgets import BookmarkSearchBar, URLEmptyStateWidget
+from nexus.gui.widgets import BookmarkSearchBar, URLEmptyStateWidget, URLTableWidget
 
 
 os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
@@ -98,3 +98,18 @@ def test_main_window_global_paste_routing():
         "https://nexus.local",
         "https://safari.local",
     ]
+
+
+def test_url_table_bulk_load_emits_once():
+    _app()
+    table = URLTableWidget()
+    emitted = []
+    item_changes = []
+    table.urls_changed.connect(emitted.append)
+    table.itemChanged.connect(item_changes.append)
+
+    table.replace_urls(["https://b.example", "https://a.example", "https://c.example"])
+
+    assert emitted == [["https://a.example", "https://b.example", "https://c.example"]]
+    assert item_changes == []
+    assert not table.is_bulk_updating()
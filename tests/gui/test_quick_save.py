@@ -12,29 +12,10 @@ os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
 pytest.importorskip("PySide6")
 
 from PySide6.QtCore import Qt
-from PySide6.QtWidgets import QApplication
 
 from nexus.gui.main_window import QUICK_SAVE_FOLDER_NAME, MainWindow
 
 
-@pytest.fixture
-def app():
-    a = QApplication.instance() or QApplication([])
-    yield a
-
-
-@pytest.fixture
-def window(tmp_path, monkeypatch, app):
-    from PySide6.QtCore import QStandardPaths
-
-    monkeypatch.setattr(QStandardPaths, "writableLocation", lambda *_: str(tmp_path))
-    w = MainWindow()
-    try:
-        yield w
-    finally:
-        w.close()
-
-
 def _folder_names(window: MainWindow) -> list[str]:
     tree = window.bookmark_tree
     return [tree.topLevelItem(i).text(0) for i in range(tree.topLevelItemCount())]
@@ -8,17 +8,11 @@ import pytest
 os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
 pytest.importorskip("PySide6")
 
-from PySide6.QtWidgets import QApplication, QDialogButtonBox
+from PySide6.QtWidgets import QDialogButtonBox
 
 from nexus.gui.dialogs.save_group_dialog import SaveGroupDialog
 
 
-@pytest.fixture
-def app():
-    a = QApplication.instance() or QApplication([])
-    yield a
-
-
 def test_default_target_is_first_folder(app):
     dlg = SaveGroupDialog(folders=["Favorites", "Work", "Tech"])
     assert dlg.target_folder == "Favorites"
@@ -9,31 +9,7 @@ os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
 pytest.importorskip("PySide6")
 
 from PySide6.QtCore import Qt
-from PySide6.QtWidgets import (
-    QAbstractItemView,
-    QApplication,
-)
-
-from nexus.gui.main_window import MainWindow
-
-
-@pytest.fixture
-def app():
-    a = QApplication.instance() or QApplication([])
-    yield a
-
-
-@pytest.fixture
-def window(tmp_path, monkeypatch, app):
-    """Build a MainWindow whose bookmark/group files live in tmp_path."""
-    from PySide6.QtCore import QStandardPaths
-
-    monkeypatch.setattr(QStandardPaths, "writableLocation", lambda *_: str(tmp_path))
-    w = MainWindow()
-    try:
-        yield w
-    finally:
-        w.close()
+from PySide6.QtWidgets import QAbstractItemView
 
 
 def test_default_tabs_load_in_spec_order(window):
@@ -139,6 +115,9 @@ class _FakeMenu:
     def setStyleSheet(self, *args, **kwargs):
         pass
 
+    def setObjectName(self, *args, **kwargs):
+        pass
+
     def addSeparator(self):
         pass
 
@@ -102,6 +102,7 @@ def test_main_window_starts_with_empty_url_state(tmp_path, monkeypatch):
     class _TestPaths:
         class StandardLocation:
             AppDataLocation = object()
+            CacheLocation = object()
 
         @staticmethod
         def writableLocation(_location):
@@ -133,6 +134,7 @@ def test_main_window_uses_custom_titlebar_shell_on_macos(tmp_path, monkeypatch):
     class _TestPaths:
         class StandardLocation:
             AppDataLocation = object()
+            CacheLocation = object()
 
         @staticmethod
         def writableLocation(_location):
@@ -166,6 +168,7 @@ def test_main_window_migrates_sidebar_folders_to_reference_set(tmp_path, monkeyp
     class _TestPaths:
         class StandardLocation:
             AppDataLocation = object()
+            CacheLocation = object()
 
         @staticmethod
         def writableLocation(_location):
@@ -244,3 +247,129 @@ def test_main_window_migrates_sidebar_folders_to_reference_set(tmp_path, monkeyp
         assert misc_style["start"] == "#D4A05A"
     finally:
         window.close()
+
+
+def test_main_window_stages_settings_until_close(tmp_path, monkeypatch):
+    _app()
+
+    class _TestPaths:
+        class StandardLocation:
+            AppDataLocation = object()
+            CacheLocation = object()
+
+        @staticmethod
+        def writableLocation(_location):
+            return str(tmp_path)
+
+    settings_path = str(tmp_path / "ui.ini")
+    monkeypatch.setattr(main_window_module, "QStandardPaths", _TestPaths)
+    monkeypatch.setattr(
+        main_window_module,
+        "QSettings",
+        lambda: QSettings(settings_path, QSettings.Format.IniFormat),
+    )
+
+    window = main_window_module.MainWindow()
+    try:
+        window._set_setting("richLinks/sortAlpha", True)
+        assert window._get_setting("richLinks/sortAlpha", False, bool) is True
+        assert window.settings.value("richLinks/sortAlpha") is None
+    finally:
+        window.close()
+
+    stored = QSettings(settings_path, QSettings.Format.IniFormat)
+    assert stored.value("richLinks/sortAlpha", False, type=bool) is True
+    assert stored.value("theme/custom_safari_primary") == "#4A8FC0"
+
+
+def test_main_window_batches_bookmark_clicks(tmp_path, monkeypatch):
+    _app()
+
+    class _TestPaths:
+        class StandardLocation:
+            AppDataLocation = object()
+            CacheLocation = object()
+
+        @staticmethod
+        def writableLocation(_location):
+            return str(tmp_path)
+
+    started: list[list[str]] = []
+
+    class _FakeWorker:
+        def __init__(self, _func, urls, _private_mode):
+            self.urls = urls
+
+        def start(self):
+            started.append(self.urls)
+
+    monkeypatch.setattr(main_window_module, "QStandardPaths", _TestPaths)
+    monkeypatch.setattr(
+        main_window_module,
+        "QSettings",
+        lambda: QSettings(str(tmp_path / "ui.ini"), QSettings.Format.IniFormat),
+    )
+    monkeypatch.setattr(main_window_module, "AsyncWorker", _FakeWorker)
+
+    window = main_window_module.MainWindow()
+    try:
+        for url in ("https://a.example", "https://b.example", "https://a.example"):
+            item = QTreeWidgetItem([url])
+            item.setData(0, Qt.ItemDataRole.UserRole, {"type": "bookmark", "url": url})
+            window._open_bookmark_link(item)
+
+        assert started == []
+        window._bookmark_flush_timer.stop()
+        window._flush_pending_bookmark_urls()
+        assert started == [["https://a.example", "https://b.example"]]
+    finally:
+        window.close()
+
+
+def test_main_window_folder_lookup_survives_rename(tmp_path, monkeypatch):
+    _app()
+
+    class _TestPaths:
+        class StandardLocation:
+            AppDataLocation = object()
+            CacheLocation = object()
+
+        @staticmethod
+        def writableLocation(_location):
+            return str(tmp_path)
+
+    monkeypatch.setattr(main_window_module, "QStandardPaths", _TestPaths)
+    monkeypatch.setattr(
+        main_window_module,
+        "QSettings",
+        lambda: QSettings(str(tmp_path / "ui.ini"), QSettings.Format.IniFormat),
+    )
+
+    window = main_window_module.MainWindow()
+    try:
+        folder = window._find_or_create_folder("Reading")
+        assert window._find_or_create_folder("Reading") is folder
+
+        data = folder.data(0, Qt.ItemDataRole.UserRole)
+        folder.setData(0, Qt.ItemDataRole.UserRole, {**data, "name": "Later"})
+        assert window._find_or_create_folder("Later") is folder
+        assert window._find_or_create_folder("Reading") is not folder
+    finally:
+        window.close()
+
+
+def test_url_table_sets_status_for_all_rows():
+    _app()
+    table = URLTableWidget()
+    table.replace_urls(["https://a.example", "https://b.example"])
+    changed: list[object] = []
+    table.itemChanged.connect(changed.append)
+
+    table.set_all_status("failed")
+
+    for row in range(table.rowCount()):
+        status_item = table.item(row, 2)
+        assert status_item is not None
+        assert status_item.text() == "Failed"
+        assert status_item.data(Qt.ItemDataRole.UserRole) == "failed"
+    assert changed == []
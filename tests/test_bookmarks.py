@@ -5,12 +5,35 @@ plist parsing, bookmark data models, and folder hierarchy.
 """
 
 import json
+import pickle
 import plistlib
+from pathlib import PurePosixPath
 from typing import Any
 
+import pytest
+
+from nexus.core import bookmarks
 from nexus.core.bookmarks import BookmarkManager
 from nexus.core.models import Bookmark, BookmarkFolder
 
+# Sample Safari plist structure, shared by the binary-format tests.
+PLIST_FIXTURE: dict[str, Any] = {
+    "Title": "Test Bookmarks",
+    "Children": [
+        {
+            "URLString": "https://test.com",
+            "URIDictionary": {"title": "Test"},
+            "WebBookmarkType": "WebBookmarkTypeLeaf",
+        }
+    ],
+}
+
+
+@pytest.fixture(scope="module")
+def binary_plist_bytes() -> bytes:
+    """Serialize :data:`PLIST_FIXTURE` to binary plist once per module."""
+    return plistlib.dumps(PLIST_FIXTURE, fmt=plistlib.FMT_BINARY)
+
 
 def test_bookmark_data_structure():
     """Test basic bookmark data structure."""
@@ -75,25 +98,13 @@ def test_nested_bookmark_structure():
     )
 
 
-def test_plist_binary_format_handling():
+def test_plist_binary_format_handling(binary_plist_bytes):
     """Test that we can handle binary plist format."""
-    # Create a sample plist structure
-    test_data = {
-        "Title": "Test Bookmarks",
-        "Children": [
-            {
-                "URLString": "https://test.com",
-                "URIDictionary": {"title": "Test"},
-                "WebBookmarkType": "WebBookmarkTypeLeaf",
-            }
-        ],
-    }
-
-    # Serialize to binary plist
-    binary_plist = plistlib.dumps(test_data, fmt=plistlib.FMT_BINARY)
+    assert binary_plist_bytes.startswith(b"bplist00")
 
     # Verify we can deserialize it
-    loaded_data = plistlib.loads(binary_plist)
+    loaded_data = plistlib.loads(binary_plist_bytes)
+    assert loaded_data == PLIST_FIXTURE
     assert loaded_data["Title"] == "Test Bookmarks"
     assert len(loaded_data["Children"]) == 1
     assert loaded_data["Children"][0]["URLString"] == "https://test.com"
@@ -268,7 +279,9 @@ def test_load_bookmarks_keeps_valid_nodes_when_sibling_is_malformed(tmp_path):
 
 def test_load_bookmarks_recovers_from_bak_when_primary_missing(tmp_path):
     """Interrupted atomic save leaves only .bak — load must restore it."""
-    manager = BookmarkManager(tmp_path / "bookmarks_v2.json")
+    manager = BookmarkManager(
+        tmp_path / "bookmarks_v2.json", cache_dir=tmp_path / "cache"
+    )
     backup = manager.file_path.with_suffix(".bak")
     backup.write_text(
         json.dumps(
@@ -295,6 +308,8 @@ def test_load_bookmarks_recovers_from_bak_when_primary_missing(tmp_path):
     assert isinstance(bookmarks[0], BookmarkFolder)
     assert bookmarks[0].children[0].name == "Recovered"
     assert manager.file_path.exists()
+    # The backup is parsed, never cached.
+    assert not (tmp_path / "cache").exists()
 
 
 def test_load_bookmarks_keeps_valid_children_when_sibling_is_malformed(tmp_path):
@@ -471,3 +486,92 @@ def test_load_bookmarks_keeps_valid_children_when_sibling_child_malformed(tmp_pa
     assert isinstance(folder, BookmarkFolder)
     assert len(folder.children) == 1
     assert folder.children[0].name == "Keep Me"
+
+
+def test_load_bookmarks_reuses_parse_cache_until_file_changes(tmp_path, monkeypatch):
+    data_dir = tmp_path / "data"
+    manager = BookmarkManager(
+        data_dir / "bookmarks_v2.json", cache_dir=tmp_path / "cache"
+    )
+    manager.save_bookmarks(
+        [BookmarkFolder(name="Tech", children=[Bookmark("Ex", "https://example.com")])]
+    )
+    first = manager.load_bookmarks()
+    assert manager.parse_cache_path is not None
+    assert manager.parse_cache_path.parent == tmp_path / "cache"
+    assert manager.parse_cache_path.exists()
+    assert bookmarks.Config.APP_VERSION in manager.parse_cache_path.name
+    # Nothing but the bookmark file and its backup lands in the data dir.
+    assert {path.suffix for path in data_dir.iterdir()} <= {".json", ".bak"}
+
+    def fail_load_path(*_args, **_kwargs):
+        raise AssertionError("unchanged bookmark file was parsed again")
+
+    monkeypatch.setattr(bookmarks, "load_path", fail_load_path)
+    second = manager.load_bookmarks()
+    assert second == first
+    assert second[0] is not first[0]
+
+    monkeypatch.undo()
+    manager.save_bookmarks([BookmarkFolder(name="Work", children=[])])
+    assert [node.name for node in manager.load_bookmarks()] == ["Work"]
+
+
+def test_load_bookmarks_ignores_parse_cache_with_foreign_globals(tmp_path):
+    manager = BookmarkManager(
+        tmp_path / "bookmarks_v2.json", cache_dir=tmp_path / "cache"
+    )
+    manager.save_bookmarks([BookmarkFolder(name="Tech", children=[])])
+    cache_key = manager._parse_cache_key(manager.file_path)
+    assert cache_key is not None
+    assert manager.parse_cache_path is not None
+    # Only the bookmark models may be resolved; any other global is rejected.
+    manager.parse_cache_path.parent.mkdir()
+    manager.parse_cache_path.write_bytes(
+        pickle.dumps((cache_key, [PurePosixPath("Evil")]))
+    )
+
+    assert manager.load_bookmarks() == [BookmarkFolder(name="Tech", children=[])]
+
+
+def test_deserialize_deeply_nested_folders_without_recursion(tmp_path):
+    manager = BookmarkManager(tmp_path / "bookmarks_v2.json")
+    root: dict[str, Any] = {"type": "folder", "name": "0", "children": []}
+    current = root
+    for depth in range(1, 3000):
+        child = {"type": "folder", "name": str(depth), "children": []}
+        current["children"] = [{"type": "bookmark", "name": "bad"}, child]
+        current = child
+    current["children"] = [{"type": "bookmark", "name": "Ex", "url": "example.com"}]
+
+    node = manager._deserialize_node(root)
+
+    depth = 0
+    while isinstance(node, BookmarkFolder) and node.name != "2999":
+        # The invalid sibling is skipped; the nested folder is kept.
+        assert len(node.children) == 1
+        node = node.children[0]
+        depth += 1
+    assert depth == 2999
+    assert node.children == [Bookmark(name="Ex", url="https://example.com")]
+
+
+def test_load_bookmarks_keeps_section_order_and_skips_invalid_section(tmp_path):
+    manager = BookmarkManager(tmp_path / "bookmarks_v2.json")
+    sections: list[Any] = [
+        {
+            "type": "folder",
+            "name": f"Section {i}",
+            "children": [
+                {"type": "bookmark", "name": str(i), "url": f"example{i}.com"}
+            ],
+        }
+        for i in range(12)
+    ]
+    sections.insert(5, "orphan string entry")
+    manager.file_path.write_text(json.dumps(sections), encoding="utf-8")
+
+    bookmarks = manager.load_bookmarks()
+
+    assert [node.name for node in bookmarks] == [f"Section {i}" for i in range(12)]
+    assert bookmarks[7].children == [Bookmark(name="7", url="https://example7.com")]
@@ -1,4 +1,21 @@
+import os
+import subprocess
+import sys
 import unittest
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+
+# Pure-logic modules whose tests must not pay for building the GUI layer.
+CORE_MODULES = (
+    "nexus.core.bookmarks",
+    "nexus.core.group_store",
+    "nexus.core.link_converter",
+    "nexus.core.models",
+    "nexus.core.safari",
+    "nexus.utils.json_helpers",
+    "nexus.utils.url_processor",
+)
 
 
 class TestImports(unittest.TestCase):
@@ -6,6 +23,25 @@ class TestImports(unittest.TestCase):
         """Verify that all modules can be imported without error."""
         self.assertTrue(True)
 
+    def test_core_modules_do_not_import_gui(self):
+        """Core and utils modules load without nexus.main or nexus.gui."""
+        script = (
+            "import importlib, sys\n"
+            f"for name in {CORE_MODULES!r}:\n"
+            "    importlib.import_module(name)\n"
+            "print(sorted(m for m in sys.modules\n"
+            "             if m == 'nexus.main' or m.startswith('nexus.gui')))\n"
+        )
+        env = {**os.environ, "PYTHONPATH": str(SRC_DIR)}
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            capture_output=True,
+            text=True,
+            env=env,
+            check=True,
+        )
+        self.assertEqual(result.stdout.strip(), "[]")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,10 @@
+from __future__ import annotations
+
+from nexus.utils.color_helpers import qcolor
+
+
+def test_qcolor_parses_hex_and_reuses_instance() -> None:
+    color = qcolor("#5B8DEF")
+
+    assert color.name().upper() == "#5B8DEF"
+    assert qcolor("#5B8DEF") is color
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from nexus.utils import json_helpers
+
+
+def test_dumps_pretty_round_trips_unicode() -> None:
+    data = [{"name": "Café", "url": "https://example.com", "children": []}]
+
+    encoded = json_helpers.dumps_pretty(data)
+
+    assert isinstance(encoded, bytes)
+    assert "Café" in encoded.decode("utf-8")
+    assert json.loads(encoded) == data
+
+
+def test_dumps_pretty_falls_back_to_stdlib(monkeypatch) -> None:
+    monkeypatch.setattr(json_helpers, "orjson", None)
+
+    encoded = json_helpers.dumps_pretty({"a": [1, 2]})
+
+    assert encoded == b'{\n  "a": [\n    1,\n    2\n  ]\n}'
+
+
+def test_load_path_decodes_with_either_backend(tmp_path, monkeypatch) -> None:
+    path = tmp_path / "data.json"
+    data = [{"name": "Café", "children": []}]
+    path.write_bytes(json_helpers.dumps_pretty(data))
+    bad = tmp_path / "bad.json"
+    bad.write_bytes(b'["\xff"]')
+
+    assert json_helpers.load_path(path) == data
+    with pytest.raises(json.JSONDecodeError):
+        json_helpers.load_path(bad)
+
+    monkeypatch.setattr(json_helpers, "orjson", None)
+    assert json_helpers.load_path(path) == data
+    with pytest.raises(json.JSONDecodeError):
+        json_helpers.load_path(bad)
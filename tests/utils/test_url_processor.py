@@ -1,5 +1,6 @@
 import unittest
 
+from nexus.utils import url_processor
 from nexus.utils.url_processor import URLProcessor
 
 
@@ -18,6 +19,12 @@ class TestURLProcessor(unittest.TestCase):
         self.assertIn("http://b.com", urls)
         self.assertEqual(len(urls), 2)
 
+    def test_extract_urls_skips_text_without_a_dot(self):
+        processor = URLProcessor()
+        processor._extract_urls_enhanced = None  # would raise if reached
+
+        self.assertEqual(processor.extract_urls("no links in this note"), [])
+
     def test_normalize_url(self):
         processor = URLProcessor()
         # Test adding scheme
@@ -53,6 +60,48 @@ class TestURLProcessor(unittest.TestCase):
             ["https://bit.ly/abc/path"],
         )
 
+    def test_extract_urls_does_not_reparse_inside_protocol_urls(self):
+        processor = URLProcessor()
+
+        self.assertEqual(
+            processor.extract_urls("ftp://files.example.com/pub"),
+            ["ftp://files.example.com/pub"],
+        )
+
+    @unittest.skipIf(url_processor.ahocorasick is None, "pyahocorasick not installed")
+    def test_substring_automaton_matches_pure_python_path(self):
+        processor = URLProcessor()
+        urls = ["bit.ly/abc", "bit.ly/abc/path", "example.com", "https://example.com?q"]
+        sorted_urls = sorted(urls, key=len, reverse=True)
+
+        self.assertEqual(
+            processor._remove_url_substrings_with_automaton(sorted_urls),
+            ["https://example.com?q", "bit.ly/abc/path"],
+        )
+
+    @unittest.skipIf(url_processor.re2 is None, "google-re2 not installed")
+    def test_re2_scanner_matches_re_candidates(self):
+        scanner = url_processor._compile_re2_scanner()
+        text = "a.b.co.uk/x www.EXAMPLE.com bit.ly/abc https://x.com/a,b 1.2.3"
+
+        self.assertIsNotNone(scanner)
+        self.assertEqual(
+            [m.group(0) for m in scanner.finditer(text)],
+            [m.group(0) for m in url_processor._COMBINED_PATTERN.finditer(text)],
+        )
+
+    def test_normalize_urls_matches_scalar_normalization(self):
+        processor = URLProcessor()
+        urls = ["example.com", "localhost", " www.a.org/x. ", "example.com", ""]
+
+        self.assertEqual(
+            processor.normalize_urls(urls),
+            [processor._normalize_url(url) for url in urls],
+        )
+        self.assertEqual(
+            processor.normalize_urls(iter(urls[:2])), ["https://example.com", None]
+        )
+
     def test_sanitize_text_removes_zero_width_and_non_printable_chars(self):
         processor = URLProcessor()
 
@@ -60,6 +109,10 @@ class TestURLProcessor(unittest.TestCase):
             processor.sanitize_text_for_extraction("https://exa\u200bmple.com\noké"),
             "https://example.com ok",
         )
+        self.assertEqual(
+            processor.sanitize_text_for_extraction("a\x85\u00a0b\ufeff \t\r\n c "),
+            "ab c",
+        )
 
     def test_extension_filter_distinguishes_files_from_urls(self):
         processor = URLProcessor()